@@ -5,31 +5,33 @@
 """
 
 import streamlit as st
-import json
+import codecs
+import hashlib
+import html
 import os
-import sys
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-
-# 添加src目录到路径
-sys.path.append(str(Path(__file__).parent / 'src'))
 
 from config import Config
-from src.polishing.multi_round_polisher import MultiRoundPolisher
-from src.analysis.quality_scorer import QualityScorer
-from src.analysis.style_guide_generator import StyleGuideGenerator
-from src.log import get_log_summary, get_recent_errors, get_recent_warnings, search_logs_by_keyword, get_log_files_info
+from src.utils.json_utils import load_json
+from src.log import scan_log, search_logs_by_keyword, get_log_files_info
 
 # 设置日志
 from src.utils.logger_config import setup_logging, get_logger
 setup_logging()
 logger = get_logger(__name__)
-logger.info("=" * 60)
-logger.info("Streamlit Web应用启动")
-logger.info("=" * 60)
+
+@st.cache_resource(show_spinner=False)
+def log_app_startup():
+    """记录应用启动日志（每个进程只写一次；Streamlit每次交互都会重跑脚本，若每次都写入会改变日志文件签名，使日志查询缓存失效）"""
+    logger.info("=" * 60)
+    logger.info("Streamlit Web应用启动")
+    logger.info("=" * 60)
+
+log_app_startup()
 
 # 页面配置
 st.set_page_config(
@@ -39,61 +41,189 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 自定义CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .section-header {
-        font-size: 1.5rem;
-        font-weight: bold;
-        color: #2e8b57;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    .score-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-        margin: 0.5rem 0;
-    }
-    .modification-card {
-        background-color: #ffffff;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #e1e5e9;
-        margin: 0.5rem 0;
-    }
-    .success-card {
-        background-color: #d4edda;
-        border-left: 4px solid #28a745;
-    }
-    .warning-card {
-        background-color: #fff3cd;
-        border-left: 4px solid #ffc107;
-    }
-    /* 限制selectbox宽度 */
-    .stSelectbox > div > div {
-        max-width: 150px !important;
-        width: 150px !important;
-    }
-    /* 限制selectbox容器宽度 */
-    .stSelectbox {
-        max-width: 150px !important;
-        width: 150px !important;
-    }
-    /* 针对润色风格selectbox的特殊样式 */
-    .stSelectbox label {
-        font-size: 0.9rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+# 自定义CSS（每次重跑都需注入，只保留页面实际使用的样式）
+CSS_PATH = Path(__file__).parent / 'static' / 'app.css'
+
+@st.cache_data(show_spinner=False)
+def load_css(path, mtime):
+    """读取样式表并压缩（去掉注释、合并空白），按修改时间缓存"""
+    raw = Path(path).read_text(encoding='utf-8')
+    css = re.sub(r'\s+', ' ', re.sub(r'/\*.*?\*/', '', raw, flags=re.S))
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css).strip()
+    return f"<style>{css}</style>"
+
+st.markdown(load_css(str(CSS_PATH), CSS_PATH.stat().st_mtime), unsafe_allow_html=True)
+
+# 页面标题HTML（静态内容，模块加载时生成一次）
+SECTION_HEADER = '<div class="section-header">{}</div>'
+MAIN_HEADER = '<div class="main-header">📝 论文风格分析与润色系统</div>'
+HDR_POLISH = SECTION_HEADER.format('📝 论文润色')
+HDR_POLISH_RESULT = SECTION_HEADER.format('✨ 润色结果')
+HDR_POLISHED_TEXT = SECTION_HEADER.format('📄 润色后的论文')
+HDR_MODIFICATIONS = SECTION_HEADER.format('📝 修改详情')
+HDR_QUALITY = SECTION_HEADER.format('📊 质量评估')
+HDR_QUALITY_RESULT = SECTION_HEADER.format('📈 质量评分结果')
+HDR_STYLE_GUIDE = SECTION_HEADER.format('📖 风格指南')
+HDR_SYSTEM_STATUS = SECTION_HEADER.format('⚙️ 系统状态')
+HDR_LOGS = SECTION_HEADER.format('📋 日志管理')
+
+@st.cache_data(show_spinner=False)
+def load_guide(path, mtime):
+    """加载风格指南JSON（按路径和修改时间缓存，文件更新后自动失效）"""
+    return load_json(path)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_polish_style_guide(path, mtime):
+    """润色使用的混合风格指南（只读，所有会话共享同一对象；按修改时间缓存，文件更新后自动重新加载）"""
+    return load_json(path)
+
+def new_polisher():
+    """创建本次润色专用的润色器（润色状态各自独立，会话之间互不阻塞；风格指南、评分器和AI客户端共享）"""
+    from src.polishing.multi_round_polisher import MultiRoundPolisher
+    probe = probe_file(HYBRID_GUIDE_PATH)
+    # 指南不存在时交给润色器自行加载并报错
+    style_guide = get_polish_style_guide(str(HYBRID_GUIDE_PATH), probe[1]) if probe else None
+    return MultiRoundPolisher(style_guide=style_guide, quality_scorer=get_scorer())
+
+@st.cache_resource(show_spinner=False)
+def get_scorer():
+    """获取共享的质量评分器实例"""
+    from src.analysis.quality_scorer import QualityScorer
+    return QualityScorer()
+
+@st.cache_resource(show_spinner=False)
+def validate_config():
+    """验证配置并返回当前AI配置（每个进程只执行一次；验证失败时不缓存，下次重跑会重试）"""
+    Config.validate()
+    return Config.get_ai_config()
+
+def text_digest(text):
+    """计算文本的blake2b摘要（16字节），作为长文本的缓存键，避免对全文做默认哈希"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def score_text(digest, _text):
+    """对文本进行质量评分（按文本摘要缓存，原文不参与哈希）"""
+    return get_scorer().score_paper(_text)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def count_dir_entries(dir_path):
+    """统计目录中的条目数（os.scandir 不为每个条目额外 stat，结果缓存5秒），目录不存在时返回-1"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return sum(1 for _ in entries)
+    except FileNotFoundError:
+        return -1
+
+@st.cache_data(ttl=5, show_spinner=False)
+def scan_files(dir_path):
+    """一次 os.scandir 获取目录下各文件的 {文件名: (字节数, 修改时间)}（目录不存在时返回空字典，结果缓存5秒）"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {
+                entry.name: (stat.st_size, stat.st_mtime)
+                for entry in entries if entry.is_file()
+                for stat in (entry.stat(),)
+            }
+    except FileNotFoundError:
+        return {}
+
+def probe_file(file_path):
+    """获取文件的 (字节数, 修改时间)，文件不存在时返回None（同目录文件共用一次扫描结果）"""
+    dir_path, file_name = os.path.split(str(file_path))
+    return scan_files(dir_path or '.').get(file_name)
+
+def get_file_size(file_path):
+    """获取文件大小（字节），文件不存在时返回None"""
+    probe = probe_file(file_path)
+    return probe[0] if probe else None
+
+def _file_mtime(path):
+    """获取文件修改时间（用作缓存键），文件不存在时抛出FileNotFoundError"""
+    probe = probe_file(path)
+    if probe is None:
+        raise FileNotFoundError(f"文件不存在: {path}")
+    return probe[1]
+
+# 日志查询默认读取的目录（与 LogQuery 的默认值一致）
+LOGS_DIR = 'logs'
+
+def log_signature():
+    """日志目录中各 .log 文件的 (文件名, 字节数, 修改时间)，作为日志查询结果的缓存键"""
+    return tuple(sorted(
+        (name, size, mtime)
+        for name, (size, mtime) in scan_files(LOGS_DIR).items()
+        if name.endswith('.log')
+    ))
+
+@st.cache_data(ttl=30, max_entries=4, show_spinner=False)
+def cached_log_overview(signature, recent_limit=10):
+    """日志摘要、最近错误/警告和日志文件信息（解析日志与读取文件信息互不依赖，两个线程同时进行；日志文件未变化时直接复用）"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scan_future = executor.submit(scan_log, recent_limit)
+        files_future = executor.submit(get_log_files_info)
+        return scan_future.result(), files_future.result()
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def cached_search_logs(signature, keyword, limit):
+    """按关键词搜索日志（相同关键词和数量在日志文件未变化时直接复用结果）"""
+    return search_logs_by_keyword(keyword, limit)
+
+# 风格指南文件路径
+HYBRID_GUIDE_PATH = Path("data/hybrid_style_guide.json")
+HYBRID_GUIDE_MD_PATH = Path("data/hybrid_style_guide.md")
+STYLE_GUIDE_PATH = Path(Config.STYLE_GUIDE_JSON)
+STYLE_GUIDE_MD_PATH = Path(Config.STYLE_GUIDE_MD)
+
+# 系统状态页检查的数据目录和重要文件
+STATUS_DATA_DIRS = (
+    ("期刊PDF", Config.JOURNALS_DIR),
+    ("提取文本", Config.EXTRACTED_DIR),
+    ("单篇报告", Config.INDIVIDUAL_REPORTS_DIR),
+    ("批次汇总", Config.BATCH_SUMMARIES_DIR)
+)
+STATUS_IMPORTANT_FILES = (
+    ("混合风格指南JSON", HYBRID_GUIDE_PATH),
+    ("混合风格指南MD", HYBRID_GUIDE_MD_PATH),
+    ("分析日志", Path(Config.ANALYSIS_LOG))
+)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _guide_status():
+    """检查混合/标准风格指南是否存在（两者同在数据目录时只扫描一次目录，结果缓存5秒）"""
+    listings = {}
+    for directory in {HYBRID_GUIDE_PATH.parent, STYLE_GUIDE_PATH.parent}:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            listings[directory] = set()
+    return (
+        HYBRID_GUIDE_PATH.name in listings[HYBRID_GUIDE_PATH.parent],
+        STYLE_GUIDE_PATH.name in listings[STYLE_GUIDE_PATH.parent],
+    )
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def decode_upload(file_id, name, size, _uploaded_file):
+    """解码上传文件（按上传ID、文件名和大小缓存，重跑时不再重复解码；文件对象本身不参与哈希）"""
+    return _decode_uploaded_file(_uploaded_file)
+
+def _decode_uploaded_file(uploaded_file, chunk_size=1 << 20):
+    """按块增量解码上传文件，避免整块读取后再复制一份解码结果（非UTF-8内容抛出UnicodeDecodeError）"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='strict')
+    uploaded_file.seek(0)
+    parts = []
+    while True:
+        chunk = uploaded_file.read(chunk_size)
+        if not chunk:
+            break
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b'', final=True))
+    return ''.join(parts)
+
+def _load_guide_file(path):
+    path = Path(path)
+    return load_guide(str(path), _file_mtime(path))
 
 def _count_string_leaves(data):
     if isinstance(data, dict):
@@ -161,6 +291,90 @@ def compute_hybrid_rule_counts(guide):
     
     return total_rules or 0, official_rules or 0, empirical_rules or 0
 
+# 混合指南基于的论文数量（指南文件中未记录该字段）
+HYBRID_GUIDE_PAPER_COUNT = 80
+
+@dataclass(frozen=True)
+class GuideSummary:
+    """风格指南规则统计摘要（侧边栏、风格指南、系统状态页共用）"""
+    total_rules: int = 0
+    official_rules: int = 0
+    empirical_rules: int = 0
+    core_rules: int = 0
+    optional_rules: int = 0
+    paper_count: int = 0
+    category_counts: tuple = ()  # ((类别名, 规则数), ...)，仅标准指南
+
+@st.cache_data(show_spinner=False)
+def summarize_guide(path, mtime, guide_type):
+    """计算风格指南的规则统计（按路径和修改时间缓存，避免每次重跑都遍历规则分类）"""
+    guide = load_guide(path, mtime)
+    if guide_type == "hybrid":
+        total_rules, official_rules, empirical_rules = compute_hybrid_rule_counts(guide)
+        return GuideSummary(
+            total_rules=total_rules,
+            official_rules=official_rules,
+            empirical_rules=empirical_rules,
+            paper_count=HYBRID_GUIDE_PAPER_COUNT,
+        )
+    
+    category_counts = tuple(
+        (category_name, category.get('count', 0))
+        for category_name, category in guide.get('rule_categories', {}).items()
+    )
+    counts = dict(category_counts)
+    return GuideSummary(
+        total_rules=sum(counts.values()),
+        core_rules=counts.get('frequent_rules', 0),
+        optional_rules=counts.get('common_rules', 0) + counts.get('alternative_rules', 0),
+        paper_count=guide.get('total_papers_analyzed', 0),
+        category_counts=category_counts,
+    )
+
+def _get_guide_summary(path, guide_type):
+    path = Path(path)
+    return summarize_guide(str(path), _file_mtime(path), guide_type)
+
+@st.cache_data(show_spinner=False)
+def guide_paper_count(path, mtime, guide_type):
+    """风格指南的分析论文数，文件损坏时返回None（失败结果也按修改时间缓存，重跑时不再重复解析和抛异常）"""
+    try:
+        return summarize_guide(path, mtime, guide_type).paper_count
+    except Exception as e:
+        logger.warning(f"读取风格指南失败 {path}: {str(e)}")
+        return None
+
+def _get_paper_count(path, guide_type):
+    probe = probe_file(path)
+    if probe is None:
+        return None
+    return guide_paper_count(str(path), probe[1], guide_type)
+
+EMPIRICAL_RULE_TYPES = ('frequent', 'common', 'alternative')
+
+@st.cache_data(show_spinner=False)
+def partition_guide_rules(path, mtime):
+    """一次遍历结构化混合指南的规则：统计各类别数量并拆分官方/历史经验规则（按修改时间缓存）"""
+    categories = load_guide(path, mtime).get('categories', {})
+    category_counts = {}
+    official_rules = []
+    empirical_rules = []
+    
+    for category_name, rules in categories.items():
+        category_counts[category_name] = len(rules)
+        for rule in rules:
+            rule_type = rule.get('rule_type')
+            if rule_type == 'official':
+                official_rules.append(rule)
+            elif rule_type in EMPIRICAL_RULE_TYPES:
+                empirical_rules.append(rule)
+    
+    return category_counts, official_rules, empirical_rules
+
+def _get_rule_partition(path):
+    path = Path(path)
+    return partition_guide_rules(str(path), _file_mtime(path))
+
 def _detect_hybrid_schema(guide):
     if isinstance(guide.get('categories'), dict):
         return 'structured'
@@ -229,20 +443,120 @@ def _render_pattern_entry(pattern):
     description = pattern.get('description') or pattern.get('summary') or ""
     freq_suffix = f"（{freq_text}）" if freq_text else ""
     desc_suffix = f" — {description}" if description else ""
-    st.markdown(f"- **{name}**{freq_suffix}{desc_suffix}")
+    lines = [f"- **{name}**{freq_suffix}{desc_suffix}"]
     
     examples = pattern.get('examples')
     if isinstance(examples, dict):
-        for ex_name, ex_text in examples.items():
-            st.markdown(f"    - {_format_label(ex_name)}: {ex_text}")
+        lines.extend(f"    - {_format_label(ex_name)}: {ex_text}" for ex_name, ex_text in examples.items())
     elif isinstance(examples, list):
-        for example in examples:
-            st.markdown(f"    - {example}")
+        lines.extend(f"    - {example}" for example in examples)
+    st.markdown("\n".join(lines))
+
+# 长规则列表每页显示的条数
+RULES_PAGE_SIZE = 20
+
+def _paginate(items, key, page_size=RULES_PAGE_SIZE):
+    """超过一页时显示页码输入框，只返回当前页的条目及其起始序号"""
+    if len(items) <= page_size:
+        return items, 1
+    page_count = (len(items) + page_size - 1) // page_size
+    page = st.number_input(
+        f"页码（共{page_count}页）",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        step=1,
+        key=key
+    )
+    start = (page - 1) * page_size
+    return items[start:start + page_size], start + 1
+
+def _metrics_row(pairs):
+    """在一行中并排显示多个指标，pairs 为 (标签, 值) 序列"""
+    for column, (label, value) in zip(st.columns(len(pairs)), pairs):
+        column.metric(label, value)
+
+# 官方规则示例字典中的字段（字段名, 显示前缀）
+EXAMPLE_FIELDS = (
+    ('correct', "✅ **正确**"),
+    ('incorrect', "❌ **错误**"),
+    ('explanation', "💡 **说明**"),
+)
+
+def _markdown_list(items, ordered=False):
+    """将多个条目合并为一个Markdown列表，一次输出（空列表不输出）"""
+    if ordered:
+        text = "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
+    else:
+        text = "\n".join(f"- {item}" for item in items)
+    if text:
+        st.markdown(text)
+
+def _example_lines(example):
+    """官方规则示例转为列表行：字典按正确/错误/说明拆成多行，其余原样一行"""
+    if isinstance(example, dict):
+        return [f"{prefix}: {example[field]}" for field, prefix in EXAMPLE_FIELDS if field in example]
+    return [example]
+
+def _render_official_rule_details(rule):
+    requirements = rule.get('requirements', [])
+    if requirements:
+        st.write("**要求**:")
+        _markdown_list(requirements)
+    
+    prohibitions = rule.get('prohibitions', [])
+    if prohibitions:
+        st.write("**禁止**:")
+        _markdown_list(f"❌ {proh}" for proh in prohibitions)
+    
+    examples = rule.get('examples', [])
+    if examples:
+        st.write("**示例**:")
+        _markdown_list(line for example in examples for line in _example_lines(example))
+
+def _render_empirical_rule_details(rule):
+    evidence = rule.get('evidence', '')
+    if evidence:
+        st.write(f"**证据**: {evidence}")
+    
+    statistics = rule.get('statistics', {})
+    if statistics:
+        st.write("**统计信息**:")
+        _markdown_list(
+            f"{key}: {', '.join(map(str, value)) if isinstance(value, list) else value}"
+            for key, value in statistics.items()
+        )
+    
+    examples = rule.get('examples', [])
+    if examples:
+        st.write("**示例**:")
+        _markdown_list(examples)
+
+def _render_rule_table(rules, rows, key, render_details):
+    """以单个表格展示规则列表，仅为选中的规则渲染详情"""
+    if not rows:
+        return
+    event = st.dataframe(
+        rows,
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=key
+    )
+    selected_rows = event.selection.rows
+    if not selected_rows:
+        st.caption("选择表格中的一行以查看要求与示例")
+        return
+    index = selected_rows[0]
+    rule = rules[index]
+    with st.expander(f"{index + 1}. {rule.get('description', '')}", expanded=True):
+        render_details(rule)
 
 def main():
     """主函数"""
     # 标题
-    st.markdown('<div class="main-header">📝 论文风格分析与润色系统</div>', unsafe_allow_html=True)
+    st.markdown(MAIN_HEADER, unsafe_allow_html=True)
     
     # 侧边栏
     setup_sidebar()
@@ -271,46 +585,49 @@ def setup_sidebar():
     
     # 检查配置
     try:
-        Config.validate()
+        validate_config()
         st.sidebar.success("✅ 配置验证通过")
     except Exception as e:
         st.sidebar.error(f"❌ 配置错误: {str(e)}")
         return
     
     # 检查风格指南
-    hybrid_guide_path = Path("data/hybrid_style_guide.json")
-    style_guide_path = Path(Config.STYLE_GUIDE_JSON)
+    hybrid_guide_path = HYBRID_GUIDE_PATH
+    style_guide_path = STYLE_GUIDE_PATH
+    hybrid_exists, standard_exists = _guide_status()
     
-    if hybrid_guide_path.exists():
+    if hybrid_exists:
         st.sidebar.success("✅ 混合风格指南已加载")
-        with open(hybrid_guide_path, 'r', encoding='utf-8') as f:
-            guide = json.load(f)
-        total_rules, official_rules, empirical_rules = compute_hybrid_rule_counts(guide)
-        st.sidebar.info(f"📊 总规则数: {total_rules}")
-        st.sidebar.info(f"🏛️ 官方规则: {official_rules}")
-        st.sidebar.info(f"📊 历史经验: {empirical_rules}")
-    elif style_guide_path.exists():
+        summary = _get_guide_summary(hybrid_guide_path, "hybrid")
+        st.sidebar.info(f"📊 总规则数: {summary.total_rules}")
+        st.sidebar.info(f"🏛️ 官方规则: {summary.official_rules}")
+        st.sidebar.info(f"📊 历史经验: {summary.empirical_rules}")
+    elif standard_exists:
         st.sidebar.success("✅ 标准风格指南已加载")
-        with open(style_guide_path, 'r', encoding='utf-8') as f:
-            guide = json.load(f)
-        rule_categories = guide.get('rule_categories', {})
-        total_rules = sum(category.get('count', 0) for category in rule_categories.values())
-        st.sidebar.info(f"📊 规则数量: {total_rules}")
+        summary = _get_guide_summary(style_guide_path, "standard")
+        st.sidebar.info(f"📊 规则数量: {summary.total_rules}")
     else:
         st.sidebar.warning("⚠️ 风格指南不存在")
         st.sidebar.info("请先运行: `python main.py analyze`")
     
 
+# 润色界面的输入方式与输出模式选项
+INPUT_METHOD_TEXT = "直接输入"
+INPUT_METHODS = (INPUT_METHOD_TEXT, "上传文件")
+OUTPUT_MODE_SIMPLE = "简洁输出"
+OUTPUT_MODES = (OUTPUT_MODE_SIMPLE, "完整输出")
+
+@st.fragment
 def paper_polishing_interface():
     """论文润色界面"""
-    st.markdown('<div class="section-header">📝 论文润色</div>', unsafe_allow_html=True)
+    st.markdown(HDR_POLISH, unsafe_allow_html=True)
     
     # 输入方式选择
-    input_method = st.radio("选择输入方式:", ["直接输入", "上传文件"], horizontal=True)
+    input_method = st.radio("选择输入方式:", INPUT_METHODS, horizontal=True)
     
     paper_text = ""
     
-    if input_method == "直接输入":
+    if input_method == INPUT_METHOD_TEXT:
         paper_text = st.text_area(
             "请输入论文内容:",
             height=300,
@@ -324,52 +641,151 @@ def paper_polishing_interface():
         )
         
         if uploaded_file is not None:
-            paper_text = uploaded_file.read().decode('utf-8')
-            st.success(f"✅ 文件已上传: {uploaded_file.name}")
+            max_bytes = Config.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+            if uploaded_file.size > max_bytes:
+                st.error(f"❌ 文件过大: {uploaded_file.size / 1024 / 1024:.1f} MB，最大支持 {Config.MAX_UPLOAD_SIZE_MB} MB")
+            else:
+                try:
+                    paper_text = decode_upload(uploaded_file.file_id, uploaded_file.name, uploaded_file.size, uploaded_file)
+                except UnicodeDecodeError as e:
+                    logger.warning(f"上传文件解码失败 {uploaded_file.name}: {str(e)}")
+                    st.error(f"❌ 文件不是有效的UTF-8文本: {uploaded_file.name}")
+                else:
+                    st.success(f"✅ 文件已上传: {uploaded_file.name}")
     
     if paper_text:
         output_mode = st.radio(
             "输出模式",
-            ["简洁输出", "完整输出"],
+            OUTPUT_MODES,
             index=0,
             horizontal=True,
             help="简洁输出只显示润色后文本，完整输出展示修改详情与评分对比"
         )
         
+        parallel = False
+        if output_mode == OUTPUT_MODE_SIMPLE:
+            parallel = st.checkbox(
+                "按段落并行润色",
+                help="长文润色更快；每段单独调用AI，token消耗更多"
+            )
+        
+        # 润色结果按输入文本哈希和输出模式保存在会话中（只保留最近一次），重跑或切换标签页时直接复用
+        result_key = f"polish_{text_digest(paper_text)}_{output_mode}_{parallel}"
+        
         # 润色按钮
         if st.button("🚀 开始润色", type="primary"):
             logger.info(f"开始润色论文 - 输入方式: {input_method}, 输出模式: {output_mode}")
             logger.info(f"输入文本长度: {len(paper_text)} 字符")
             
-            with st.spinner("正在润色论文..."):
-                try:
-                    # 创建润色器
-                    polisher = MultiRoundPolisher()
+            try:
+                with st.status("正在润色论文...") as status:
+                    # 获取润色器
+                    status.update(label="正在加载润色器...")
+                    polisher = new_polisher()
                     
-                    # 根据输出模式执行不同的润色方法
-                    if output_mode == "简洁输出":
-                        logger.info("使用简洁输出模式进行润色")
-                        result = polisher.polish_paper_simple(paper_text)
-                    else:
-                        logger.info("使用完整输出模式进行润色")
-                        result = polisher.polish_paper(paper_text)
+                    # 根据输出模式执行不同的润色方法，逐阶段更新进度
+                    simple = output_mode == OUTPUT_MODE_SIMPLE
+                    logger.info(f"使用{'简洁' if simple else '完整'}输出模式进行润色")
+                    result = {}
+                    for event in polisher.polish_paper_iter(paper_text, simple=simple, parallel=parallel):
+                        if event['stage'] == 'done':
+                            result = event['result']
+                        else:
+                            status.update(label=event['label'])
                     
                     if result.get('success', False):
-                        logger.info("润色成功")
-                        # 显示润色结果
-                        display_polishing_results(result, False)
+                        status.update(label="✅ 润色完成", state="complete", expanded=False)
                     else:
-                        error_msg = result.get('error', '未知错误')
-                        logger.error(f"润色失败: {error_msg}")
-                        st.error(f"❌ 润色失败: {error_msg}")
-                        
-                except Exception as e:
-                    logger.exception("润色过程中出现异常")
-                    st.error(f"❌ 润色过程中出现错误: {str(e)}")
+                        status.update(label="❌ 润色失败", state="error", expanded=False)
+                
+                if result.get('success', False):
+                    logger.info("润色成功")
+                    # 润色完成时固定时间戳，供下载文件名复用
+                    result.setdefault('_ts', datetime.now().strftime('%Y%m%d_%H%M%S'))
+                    st.session_state['polish_result'] = (result_key, result)
+                else:
+                    error_msg = result.get('error', '未知错误')
+                    logger.error(f"润色失败: {error_msg}")
+                    st.error(f"❌ 润色失败: {error_msg}")
+                    
+            except Exception as e:
+                logger.exception("润色过程中出现异常")
+                st.error(f"❌ 润色过程中出现错误: {str(e)}")
+        
+        # 显示润色结果
+        saved_key, saved_result = st.session_state.get('polish_result', (None, None))
+        if saved_key == result_key:
+            display_polishing_results(saved_result, False)
+
+# 修改卡片中展示的附加字段（字段名, 显示名称）
+MODIFICATION_FIELDS = (
+    ('reason', '修改原因'),
+    ('rule_applied', '应用规则'),
+    ('word_changed', '词汇变化'),
+    ('transition_added', '添加连接词'),
+    ('position', '位置'),
+)
+
+def _modifications_html(applied_modifications):
+    """将一轮的全部修改拼成一段HTML（一次st.markdown输出，文本内容均做转义）"""
+    parts = []
+    append = parts.append
+    escape = html.escape
+    for i, mod in enumerate(applied_modifications, 1):
+        get = mod.get
+        original_text = escape(get('original_text') or '')
+        modified_text = escape(get('modified_text') or '')
+        append(
+            f'<div class="modification-card"><strong>修改 {i}:</strong>'
+            f'<div class="modification-diff">'
+            f'<div><em>原文:</em><pre>{original_text}</pre></div>'
+            f'<div><em>修改后:</em><pre>{modified_text}</pre></div>'
+            f'</div>'
+        )
+        for field, label in MODIFICATION_FIELDS:
+            value = get(field)
+            if value:
+                append(f'<div><strong>{label}:</strong> {escape(str(value))}</div>')
+        append('</div>')
+    return ''.join(parts)
+
+def _round_title(round_info):
+    """润色轮次标题（第0轮为综合润色，不显示轮次序号）"""
+    round_number = round_info.get('round')
+    round_name = round_info.get('round_name', '')
+    if round_number == 0:
+        return round_name
+    return f"第{round_number}轮: {round_name}"
+
+def _history_row(round_info):
+    """将一轮修改记录转换为汇总表的一行"""
+    get = round_info.get
+    choices = get('user_choices')
+    return {
+        "轮次": _round_title(round_info),
+        "修改数量": get('modifications_applied', 0),
+        "句式结构": get('sentence_structure_count'),
+        "词汇优化": get('vocabulary_count'),
+        "段落衔接": get('transitions_count'),
+        "使用风格": get('style'),
+        "应用方式": "自动应用" if 'auto_applied' in round_info else ("用户确认" if choices else None),
+        "接受": len(choices.get('accepted', ())) if choices else None,
+        "拒绝": len(choices.get('rejected', ())) if choices else None
+    }
+
+@st.fragment
+def _polished_text_editor(polished_text):
+    """润色文本编辑框（独立片段，编辑时只重跑该片段）"""
+    st.text_area(
+        "润色后的内容:",
+        value=polished_text,
+        height=400,
+        key="polished_text"
+    )
 
 def display_polishing_results(result, show_scores):
     """显示润色结果"""
-    st.markdown('<div class="section-header">✨ 润色结果</div>', unsafe_allow_html=True)
+    st.markdown(HDR_POLISH_RESULT, unsafe_allow_html=True)
     
     # 检查是否为简洁模式
     is_simple_mode = result.get('simple_mode', False)
@@ -378,36 +794,29 @@ def display_polishing_results(result, show_scores):
         # 完整模式：显示修改统计
         summary = result.get('polishing_summary', {})
         if summary:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("润色轮数", summary.get('total_rounds', 0))
-            
-            with col2:
-                st.metric("应用修改", f"{summary.get('total_modifications_applied', 0)} 处")
-            with col3:
-                st.metric("修改覆盖率", f"{summary.get('estimated_coverage', 0):.0%}" if summary.get('estimated_coverage') is not None else "—")
+            coverage = summary.get('estimated_coverage')
+            _metrics_row((
+                ("润色轮数", summary.get('total_rounds', 0)),
+                ("应用修改", f"{summary.get('total_modifications_applied', 0)} 处"),
+                ("修改覆盖率", f"{coverage:.0%}" if coverage is not None else "—"),
+            ))
     else:
         # 简洁模式：只显示基本信息
         st.info("📝 已根据风格指南自动完成整体润色")
     
     # 润色后的文本
-    st.markdown('<div class="section-header">📄 润色后的论文</div>', unsafe_allow_html=True)
+    st.markdown(HDR_POLISHED_TEXT, unsafe_allow_html=True)
     
     polished_text = result.get('polished_text', '')
-    st.text_area(
-        "润色后的内容:",
-        value=polished_text,
-        height=400,
-        key="polished_text"
-    )
+    _polished_text_editor(polished_text)
     
     # 下载按钮
     if polished_text:
+        ts = result.setdefault('_ts', datetime.now().strftime('%Y%m%d_%H%M%S'))
         st.download_button(
             label="💾 下载润色结果",
             data=polished_text,
-            file_name=f"polished_paper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            file_name=f"polished_paper_{ts}.txt",
             mime="text/plain"
         )
     
@@ -415,97 +824,42 @@ def display_polishing_results(result, show_scores):
     if not is_simple_mode:
         modification_history = result.get('modification_history', [])
         if modification_history:
-            st.markdown('<div class="section-header">📝 修改详情</div>', unsafe_allow_html=True)
+            st.markdown(HDR_MODIFICATIONS, unsafe_allow_html=True)
+            
+            # 各轮修改统计汇总为一张表
+            st.dataframe(
+                [_history_row(round_info) for round_info in modification_history],
+                use_container_width=True,
+                hide_index=True
+            )
             
             for round_info in modification_history:
-                round_title = f"第{round_info['round']}轮: {round_info['round_name']} ({round_info['modifications_applied']}处修改)"
-                if round_info.get('round') == 0:
-                    round_title = f"{round_info['round_name']} ({round_info['modifications_applied']}处修改)"
+                applied_modifications = round_info.get('applied_modifications', [])
+                round_summary = round_info.get('comprehensive_summary')
+                if not applied_modifications and not round_summary:
+                    continue
                 
-                with st.expander(round_title):
-                    # 显示修改统计
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.text(f"修改数量: {round_info['modifications_applied']}")
-                        if 'sentence_structure_count' in round_info:
-                            st.text(f"句式结构: {round_info['sentence_structure_count']}处")
-                            st.text(f"词汇优化: {round_info['vocabulary_count']}处")
-                            st.text(f"段落衔接: {round_info['transitions_count']}处")
-                    
-                    with col2:
-                        if 'style' in round_info:
-                            st.text(f"使用风格: {round_info['style']}")
-                        if 'auto_applied' in round_info:
-                            st.text("应用方式: 自动应用")
-                    
+                with st.expander(_round_title(round_info)):
                     # 显示具体修改内容
-                    applied_modifications = round_info.get('applied_modifications', [])
                     if applied_modifications:
                         st.markdown("**具体修改内容:**")
-                        
-                        for i, mod in enumerate(applied_modifications, 1):
-                            with st.container():
-                                st.markdown(f"**修改 {i}:**")
-                                
-                                # 显示原文和修改后的文本
-                                col1, col2 = st.columns(2)
-                                with col1:
-                                    st.text_area(
-                                        "原文:",
-                                        value=mod.get('original_text', ''),
-                                        height=60,
-                                        key=f"original_{round_info['round']}_{i}",
-                                        disabled=True
-                                    )
-                                with col2:
-                                    st.text_area(
-                                        "修改后:",
-                                        value=mod.get('modified_text', ''),
-                                        height=60,
-                                        key=f"modified_{round_info['round']}_{i}",
-                                        disabled=True
-                                    )
-                                
-                                # 显示修改原因和规则
-                                if mod.get('reason'):
-                                    st.markdown(f"**修改原因:** {mod.get('reason', '')}")
-                                
-                                if mod.get('rule_applied'):
-                                    st.markdown(f"**应用规则:** {mod.get('rule_applied', '')}")
-                                
-                                if mod.get('word_changed'):
-                                    st.markdown(f"**词汇变化:** {mod.get('word_changed', '')}")
-                                
-                                if mod.get('transition_added'):
-                                    st.markdown(f"**添加连接词:** {mod.get('transition_added', '')}")
-                                
-                                if mod.get('position'):
-                                    st.markdown(f"**位置:** {mod.get('position', '')}")
-                                
-                                st.markdown("---")
-                    
-                    # 显示用户选择（如果是交互模式）
-                    if 'user_choices' in round_info:
-                        choices = round_info['user_choices']
-                        st.markdown("**用户选择:**")
-                        st.text(f"接受的修改: {len(choices.get('accepted', []))}")
-                        st.text(f"拒绝的修改: {len(choices.get('rejected', []))}")
+                        st.markdown(_modifications_html(applied_modifications), unsafe_allow_html=True)
                     
                     # 显示综合摘要
-                    if 'comprehensive_summary' in round_info:
-                        summary = round_info['comprehensive_summary']
-                        if summary:
-                            st.markdown("**润色摘要:**")
-                            if summary.get('overall_improvement'):
-                                st.text(f"整体改进: {summary.get('overall_improvement', '')}")
-                            if summary.get('rules_applied'):
-                                rules = summary.get('rules_applied', [])
-                                st.text(f"应用规则: {', '.join(rules) if rules else '无'}")
+                    if round_summary:
+                        st.markdown("**润色摘要:**")
+                        overall_improvement = round_summary.get('overall_improvement')
+                        if overall_improvement:
+                            st.text(f"整体改进: {overall_improvement}")
+                        rules = round_summary.get('rules_applied')
+                        if rules:
+                            st.text(f"应用规则: {', '.join(rules)}")
 
 
+@st.fragment
 def quality_assessment_interface():
     """质量评估界面"""
-    st.markdown('<div class="section-header">📊 质量评估</div>', unsafe_allow_html=True)
+    st.markdown(HDR_QUALITY, unsafe_allow_html=True)
     
     # 输入文本
     assessment_text = st.text_area(
@@ -519,11 +873,8 @@ def quality_assessment_interface():
         
         with st.spinner("正在评估论文质量..."):
             try:
-                # 创建评分器
-                scorer = QualityScorer()
-                
-                # 执行评分
-                scores = scorer.score_paper(assessment_text)
+                # 执行评分（相同文本直接复用缓存结果）
+                scores = score_text(text_digest(assessment_text), assessment_text)
                 
                 if 'error' not in scores:
                     logger.info(f"评估成功 - 总分: {scores.get('overall_score', 0)}")
@@ -537,62 +888,101 @@ def quality_assessment_interface():
                 logger.exception("评估过程中出现异常")
                 st.error(f"❌ 评估过程中出现错误: {str(e)}")
 
+# 质量评分维度（评分字段, 显示名称）
+SCORE_DIMENSIONS = (
+    ('style_match', '风格匹配'),
+    ('academic_standard', '学术规范'),
+    ('readability', '可读性'),
+)
+
+# 可读性分析维度（分析字段, 显示名称）
+READABILITY_DIMENSIONS = (
+    ('sentence_complexity', '句式复杂度'),
+    ('vocabulary_diversity', '词汇多样性'),
+    ('transition_usage', '过渡词使用'),
+)
+READABILITY_LABELS = tuple(label for _, label in READABILITY_DIMENSIONS)
+
+# 纯展示型图表：静态渲染，不加载plotly.js交互层和工具栏
+STATIC_PLOT_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+# 仪表盘：隐藏工具栏，关闭自适应重绘
+GAUGE_PLOT_CONFIG = {'displayModeBar': False, 'responsive': False}
+
+# 仪表盘2x2布局（总分、风格匹配、学术规范、可读性）
+GAUGE_DOMAINS = (
+    {'x': [0, 0.45], 'y': [0.55, 1]},
+    {'x': [0.55, 1], 'y': [0.55, 1]},
+    {'x': [0, 0.45], 'y': [0, 0.45]},
+    {'x': [0.55, 1], 'y': [0, 0.45]},
+)
+GAUGE_AXIS = {'range': [None, 100]}
+GAUGE_BAR = {'color': "darkblue"}
+GAUGE_STEPS = (
+    {'range': [0, 50], 'color': "lightgray"},
+    {'range': [50, 80], 'color': "yellow"},
+    {'range': [80, 100], 'color': "green"},
+)
+# 总分仪表盘额外显示90分阈值线
+OVERALL_GAUGE_THRESHOLD = {'line': {'color': "red", 'width': 4}, 'thickness': 0.75, 'value': 90}
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _quality_gauge_figure(overall_score, style_score, academic_score, readability_score):
+    """构建质量评分仪表盘（按分数缓存序列化后的图表）"""
+    import plotly.graph_objects as go
+    
+    values = (overall_score, style_score, academic_score, readability_score)
+    names = ("总分",) + tuple(name for _, name in SCORE_DIMENSIONS)
+    
+    traces = [
+        go.Indicator(
+            mode="gauge+number",
+            value=value,
+            domain=domain,
+            title={'text': name},
+            gauge={'axis': GAUGE_AXIS, 'bar': GAUGE_BAR, 'steps': GAUGE_STEPS}
+        )
+        for value, name, domain in zip(values, names, GAUGE_DOMAINS)
+    ]
+    traces[0].gauge.threshold = OVERALL_GAUGE_THRESHOLD
+    
+    fig = go.Figure()
+    fig.add_traces(traces)
+    fig.update_layout(height=600, showlegend=False, uirevision='scores')
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _readability_bar_figure(labels, values):
+    """构建可读性各维度柱状图（labels/values 需为元组以便缓存；直接用go.Bar，省去plotly.express构建DataFrame）"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Bar(x=labels, y=values))
+    fig.update_layout(
+        title="可读性各维度评分",
+        xaxis_title="维度",
+        yaxis_title="分数"
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _category_pie_figure(names, values):
+    """构建规则类别分布饼图（names/values 需为元组以便缓存，直接交给go.Pie，不再复制为列表）"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Pie(labels=names, values=values))
+    fig.update_layout(title="规则类别分布")
+    return fig.to_dict()
+
 def display_quality_scores(scores):
     """显示质量评分"""
-    st.markdown('<div class="section-header">📈 质量评分结果</div>', unsafe_allow_html=True)
+    st.markdown(HDR_QUALITY_RESULT, unsafe_allow_html=True)
     
     # 总体评分
     overall_score = scores.get('overall_score', 0)
     
     # 创建评分仪表盘
-    fig = make_subplots(
-        rows=2, cols=2,
-        specs=[[{'type': 'indicator'}, {'type': 'indicator'}],
-               [{'type': 'indicator'}, {'type': 'indicator'}]],
-        subplot_titles=('总分', '风格匹配', '学术规范', '可读性')
-    )
-    
-    # 总分
-    fig.add_trace(go.Indicator(
-        mode="gauge+number",
-        value=overall_score,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': "总分"},
-        gauge={'axis': {'range': [None, 100]},
-               'bar': {'color': "darkblue"},
-               'steps': [{'range': [0, 50], 'color': "lightgray"},
-                        {'range': [50, 80], 'color': "yellow"},
-                        {'range': [80, 100], 'color': "green"}],
-               'threshold': {'line': {'color': "red", 'width': 4},
-                           'thickness': 0.75, 'value': 90}}),
-        row=1, col=1)
-    
-    # 各维度评分
-    dimensions = [
-        ('style_match', '风格匹配'),
-        ('academic_standard', '学术规范'),
-        ('readability', '可读性')
-    ]
-    
-    positions = [(1, 2), (2, 1), (2, 2)]
-    
-    for i, (key, name) in enumerate(dimensions):
-        dimension_score = scores.get(key, {}).get('score', 0)
-        
-        fig.add_trace(go.Indicator(
-            mode="gauge+number",
-            value=dimension_score,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': name},
-            gauge={'axis': {'range': [None, 100]},
-                   'bar': {'color': "darkblue"},
-                   'steps': [{'range': [0, 50], 'color': "lightgray"},
-                            {'range': [50, 80], 'color': "yellow"},
-                            {'range': [80, 100], 'color': "green"}]}),
-            row=positions[i][0], col=positions[i][1])
-    
-    fig.update_layout(height=600, showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    dimension_scores = tuple((scores.get(key) or {}).get('score', 0) for key, _ in SCORE_DIMENSIONS)
+    fig = _quality_gauge_figure(overall_score, *dimension_scores)
+    st.plotly_chart(fig, use_container_width=True, config=GAUGE_PLOT_CONFIG)
     
     # 详细分析
     detailed = scores.get('detailed_analysis', {})
@@ -602,16 +992,11 @@ def display_quality_scores(scores):
         # 基础统计
         basic_stats = detailed.get('basic_stats', {})
         if basic_stats:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("字数", basic_stats.get('word_count', 0))
-            
-            with col2:
-                st.metric("句数", basic_stats.get('sentence_count', 0))
-            
-            with col3:
-                st.metric("平均句长", f"{basic_stats.get('avg_words_per_sentence', 0):.1f} 词")
+            _metrics_row((
+                ("字数", basic_stats.get('word_count', 0)),
+                ("句数", basic_stats.get('sentence_count', 0)),
+                ("平均句长", f"{basic_stats.get('avg_words_per_sentence', 0):.1f} 词"),
+            ))
         
         # 风格分析
         style_analysis = detailed.get('style_analysis', {})
@@ -625,51 +1010,41 @@ def display_quality_scores(scores):
             
             with col2:
                 st.write("**主要优点:**")
-                for strength in style_analysis.get('top_strengths', []):
-                    st.write(f"• {strength}")
+                _markdown_list(style_analysis.get('top_strengths', []))
         
         # 可读性分析
         readability_analysis = detailed.get('readability_analysis', {})
         if readability_analysis:
             st.markdown("#### 📖 可读性分析")
             
-            read_scores = [
-                readability_analysis.get('sentence_complexity', 0),
-                readability_analysis.get('vocabulary_diversity', 0),
-                readability_analysis.get('transition_usage', 0)
-            ]
-            read_labels = ['句式复杂度', '词汇多样性', '过渡词使用']
+            read_scores = tuple(readability_analysis.get(key, 0) for key, _ in READABILITY_DIMENSIONS)
             
-            fig = px.bar(
-                x=read_labels,
-                y=read_scores,
-                title="可读性各维度评分",
-                labels={'x': '维度', 'y': '分数'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _readability_bar_figure(READABILITY_LABELS, read_scores)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_PLOT_CONFIG)
     
     # 改进建议
     recommendations = scores.get('recommendations', [])
     if recommendations:
         st.markdown("### 💡 改进建议")
-        for i, rec in enumerate(recommendations, 1):
-            st.write(f"{i}. {rec}")
+        _markdown_list(recommendations, ordered=True)
 
+@st.fragment
 def style_guide_interface():
     """风格指南界面"""
-    st.markdown('<div class="section-header">📖 风格指南</div>', unsafe_allow_html=True)
+    st.markdown(HDR_STYLE_GUIDE, unsafe_allow_html=True)
     
     # 优先检查混合风格指南
-    hybrid_guide_path = Path("data/hybrid_style_guide.json")
-    style_guide_path = Path(Config.STYLE_GUIDE_JSON)
+    hybrid_guide_path = HYBRID_GUIDE_PATH
+    style_guide_path = STYLE_GUIDE_PATH
+    hybrid_exists, standard_exists = _guide_status()
     
     guide_file = None
     guide_type = None
     
-    if hybrid_guide_path.exists():
+    if hybrid_exists:
         guide_file = hybrid_guide_path
         guide_type = "hybrid"
-    elif style_guide_path.exists():
+    elif standard_exists:
         guide_file = style_guide_path
         guide_type = "standard"
     else:
@@ -679,168 +1054,83 @@ def style_guide_interface():
     
     try:
         # 加载风格指南
-        with open(guide_file, 'r', encoding='utf-8') as f:
-            guide = json.load(f)
+        guide = _load_guide_file(guide_file)
+        summary = _get_guide_summary(guide_file, guide_type)
         
         # 指南摘要
         st.markdown("### 📊 指南摘要")
         
         if guide_type == "hybrid":
-            col1, col2, col3, col4 = st.columns(4)
-            
-            total_rules, official_rules, empirical_rules = compute_hybrid_rule_counts(guide)
-            
-            with col1:
-                st.metric("总规则数", total_rules)
-            
-            with col2:
-                st.metric("官方规则", official_rules)
-            
-            with col3:
-                st.metric("历史经验规则", empirical_rules)
-            
-            with col4:
-                st.metric("分析论文数", 80)
+            _metrics_row((
+                ("总规则数", summary.total_rules),
+                ("官方规则", summary.official_rules),
+                ("历史经验规则", summary.empirical_rules),
+                ("分析论文数", summary.paper_count),
+            ))
             
             st.info("📋 当前使用：**混合风格指南** (官方规则 + 历史经验规则)")
             
         else:
             # 标准风格指南的显示逻辑
-            col1, col2, col3, col4 = st.columns(4)
-            
-            # 从rule_categories中计算规则数量
-            rule_categories = guide.get('rule_categories', {})
-            total_rules = sum(category.get('count', 0) for category in rule_categories.values())
-            
-            with col1:
-                st.metric("总规则数", total_rules)
-            
-            with col2:
-                frequent_rules = rule_categories.get('frequent_rules', {}).get('count', 0)
-                st.metric("核心规则", frequent_rules)
-            
-            with col3:
-                common_rules = rule_categories.get('common_rules', {}).get('count', 0)
-                alternative_rules = rule_categories.get('alternative_rules', {}).get('count', 0)
-                optional_rules = common_rules + alternative_rules
-                st.metric("可选规则", optional_rules)
-            
-            with col4:
-                st.metric("分析论文数", guide.get('total_papers_analyzed', 0))
+            _metrics_row((
+                ("总规则数", summary.total_rules),
+                ("核心规则", summary.core_rules),
+                ("可选规则", summary.optional_rules),
+                ("分析论文数", summary.paper_count),
+            ))
         
         if guide_type == "hybrid":
             hybrid_schema = _detect_hybrid_schema(guide)
             
             if hybrid_schema == "structured":
-                categories = guide.get('categories', {})
-                if categories:
+                category_counts, official_rules, empirical_rules = _get_rule_partition(guide_file)
+                if category_counts:
                     st.markdown("### 📂 规则类别分布")
                     
-                    category_names = list(categories.keys())
-                    category_counts = [len(rules) for rules in categories.values()]
-                    
-                    fig = px.pie(
-                        values=category_counts,
-                        names=category_names,
-                        title="规则类别分布"
-                    )
+                    fig = _category_pie_figure(tuple(category_counts.keys()), tuple(category_counts.values()))
                     st.plotly_chart(fig, use_container_width=True)
                 
                 st.markdown("### 📋 规则详情")
                 
-                official_rules = []
-                empirical_rules = []
-                
-                for category_name, rules in categories.items():
-                    for rule in rules:
-                        if rule.get('rule_type') == 'official':
-                            official_rules.append(rule)
-                        elif rule.get('rule_type') in ['frequent', 'common', 'alternative']:
-                            empirical_rules.append(rule)
-                
                 tab_official, tab_empirical = st.tabs(["🏛️ 官方规则", "📊 历史经验规则"])
                 
                 with tab_official:
                     st.markdown(f"### 🏛️ 官方规则 ({len(official_rules)}条)")
                     st.info("📌 官方规则：来自期刊官方指南，必须严格遵守")
                     
-                    for i, rule in enumerate(official_rules, 1):
-                        with st.expander(f"{i}. {rule.get('description', '')}"):
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                st.write(f"**优先级**: {rule.get('priority', '')}")
-                                st.write(f"**类别**: {rule.get('category', '')}")
-                                st.write(f"**执行级别**: {rule.get('enforcement_level', '')}")
-                                st.write(f"**置信度**: {rule.get('confidence', 0):.1%}")
-                            
-                            with col2:
-                                st.write(f"**规则ID**: `{rule.get('rule_id', '')}`")
-                                st.write(f"**来源**: {rule.get('source', '')}")
-                                if rule.get('section'):
-                                    st.write(f"**章节**: {rule.get('section', '')}")
-                            
-                            requirements = rule.get('requirements', [])
-                            if requirements:
-                                st.write("**要求**:")
-                                for req in requirements:
-                                    st.write(f"• {req}")
-                            
-                            prohibitions = rule.get('prohibitions', [])
-                            if prohibitions:
-                                st.write("**禁止**:")
-                                for proh in prohibitions:
-                                    st.write(f"• ❌ {proh}")
-                            
-                            examples = rule.get('examples', [])
-                            if examples:
-                                st.write("**示例**:")
-                                for example in examples:
-                                    if isinstance(example, dict):
-                                        if 'correct' in example:
-                                            st.write(f"✅ **正确**: {example['correct']}")
-                                        if 'incorrect' in example:
-                                            st.write(f"❌ **错误**: {example['incorrect']}")
-                                        if 'explanation' in example:
-                                            st.write(f"💡 **说明**: {example['explanation']}")
-                                    else:
-                                        st.write(f"• {example}")
+                    official_rows = [
+                        {
+                            "序号": i,
+                            "描述": rule.get('description', ''),
+                            "优先级": rule.get('priority', ''),
+                            "类别": rule.get('category', ''),
+                            "执行级别": rule.get('enforcement_level', ''),
+                            "置信度": f"{rule.get('confidence', 0):.1%}",
+                            "规则ID": rule.get('rule_id', ''),
+                            "来源": rule.get('source', ''),
+                            "章节": rule.get('section', '')
+                        }
+                        for i, rule in enumerate(official_rules, 1)
+                    ]
+                    _render_rule_table(official_rules, official_rows, "official_rules_table", _render_official_rule_details)
                 
                 with tab_empirical:
                     st.markdown(f"### 📊 历史经验规则 ({len(empirical_rules)}条)")
-                    st.info("📌 历史经验规则：基于80篇AMJ论文的分析结果")
+                    st.info(f"📌 历史经验规则：基于{HYBRID_GUIDE_PAPER_COUNT}篇AMJ论文的分析结果")
                     
-                    for i, rule in enumerate(empirical_rules, 1):
-                        with st.expander(f"{i}. {rule.get('description', '')}"):
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                st.write(f"**类别**: {rule.get('category', '')}")
-                                st.write(f"**遵循率**: {rule.get('frequency', 0):.1%}")
-                                st.write(f"**一致性**: {rule.get('consistency_rate', 0):.1%}")
-                            
-                            with col2:
-                                st.write(f"**规则ID**: `{rule.get('rule_id', '')}`")
-                                st.write(f"**来源**: {rule.get('source', '')}")
-                            
-                            evidence = rule.get('evidence', '')
-                            if evidence:
-                                st.write(f"**证据**: {evidence}")
-                            
-                            statistics = rule.get('statistics', {})
-                            if statistics:
-                                st.write("**统计信息**:")
-                                for key, value in statistics.items():
-                                    if isinstance(value, list):
-                                        st.write(f"• {key}: {', '.join(map(str, value))}")
-                                    else:
-                                        st.write(f"• {key}: {value}")
-                            
-                            examples = rule.get('examples', [])
-                            if examples:
-                                st.write("**示例**:")
-                                for example in examples:
-                                    st.write(f"• {example}")
+                    empirical_rows = [
+                        {
+                            "序号": i,
+                            "描述": rule.get('description', ''),
+                            "类别": rule.get('category', ''),
+                            "遵循率": f"{rule.get('frequency', 0):.1%}",
+                            "一致性": f"{rule.get('consistency_rate', 0):.1%}",
+                            "规则ID": rule.get('rule_id', ''),
+                            "来源": rule.get('source', '')
+                        }
+                        for i, rule in enumerate(empirical_rules, 1)
+                    ]
+                    _render_rule_table(empirical_rules, empirical_rows, "empirical_rules_table", _render_empirical_rule_details)
             else:
                 st.markdown("### 🏛️ 官方规则")
                 official_sections = _get_official_sections(guide)
@@ -864,23 +1154,18 @@ def style_guide_interface():
                         if not isinstance(pattern_list, list) or not pattern_list:
                             continue
                         st.markdown(f"**{_format_label(group_name)}** ({len(pattern_list)}条)")
-                        for pattern in pattern_list:
+                        page_patterns, _ = _paginate(pattern_list, f"patterns_page_{category_name}_{group_name}")
+                        for pattern in page_patterns:
                             _render_pattern_entry(pattern)
         
         else:
             # 标准风格指南的规则显示
             rule_categories = guide.get('rule_categories', {})
-            if rule_categories:
+            if summary.category_counts:
                 st.markdown("### 📂 规则类别分布")
                 
-                category_names = list(rule_categories.keys())
-                category_counts = [category.get('count', 0) for category in rule_categories.values()]
-                
-                fig = px.pie(
-                    values=category_counts,
-                    names=category_names,
-                    title="规则类别分布"
-                )
+                category_names, category_counts = zip(*summary.category_counts)
+                fig = _category_pie_figure(category_names, category_counts)
                 st.plotly_chart(fig, use_container_width=True)
             
             # 显示各类别规则
@@ -905,8 +1190,7 @@ def style_guide_interface():
                                 examples = rule.get('examples', [])
                                 if examples:
                                     st.write("**示例**:")
-                                    for example in examples[:2]:  # 显示前2个示例
-                                        st.write(f"• {example}")
+                                    _markdown_list(examples[:2])  # 显示前2个示例
         
         # 下载风格指南
         st.markdown("### 💾 下载风格指南")
@@ -914,62 +1198,46 @@ def style_guide_interface():
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("下载JSON版本"):
-                with open(guide_file, 'r', encoding='utf-8') as f:
-                    json_data = f.read()
-                file_name = "hybrid_style_guide.json" if guide_type == "hybrid" else "style_guide.json"
-                st.download_button(
-                    label="下载JSON",
-                    data=json_data,
-                    file_name=file_name,
-                    mime="application/json"
-                )
+            st.download_button(
+                label="下载JSON版本",
+                data=guide_file.read_bytes,  # 点击时才读取文件
+                file_name=guide_file.name,
+                mime="application/json"
+            )
         
         with col2:
-            if guide_type == "hybrid":
-                md_path = Path("data/hybrid_style_guide.md")
-                if md_path.exists():
-                    if st.button("下载Markdown版本"):
-                        with open(md_path, 'r', encoding='utf-8') as f:
-                            md_data = f.read()
-                        st.download_button(
-                            label="下载Markdown",
-                            data=md_data,
-                            file_name="hybrid_style_guide.md",
-                            mime="text/markdown"
-                        )
-                else:
-                    st.warning("Markdown版本不存在")
+            md_path = HYBRID_GUIDE_MD_PATH if guide_type == "hybrid" else STYLE_GUIDE_MD_PATH
+            if probe_file(md_path) is not None:
+                st.download_button(
+                    label="下载Markdown版本",
+                    data=md_path.read_bytes,  # 点击时才读取文件
+                    file_name=md_path.name,
+                    mime="text/markdown"
+                )
             else:
-                if st.button("下载Markdown版本") and Path(Config.STYLE_GUIDE_MD).exists():
-                    with open(Config.STYLE_GUIDE_MD, 'r', encoding='utf-8') as f:
-                        md_data = f.read()
-                    st.download_button(
-                        label="下载Markdown",
-                        data=md_data,
-                        file_name="style_guide.md",
-                        mime="text/markdown"
-                    )
+                st.warning("Markdown版本不存在")
         
     except Exception as e:
         st.error(f"❌ 加载风格指南失败: {str(e)}")
 
+@st.fragment
 def system_status_interface():
     """系统状态界面"""
-    st.markdown('<div class="section-header">⚙️ 系统状态</div>', unsafe_allow_html=True)
+    st.markdown(HDR_SYSTEM_STATUS, unsafe_allow_html=True)
     
     # 系统概览
     st.markdown("### 📊 系统概览")
     
     # 检查当前使用的风格指南类型
-    hybrid_guide_path = Path("data/hybrid_style_guide.json")
-    style_guide_path = Path(Config.STYLE_GUIDE_JSON)
+    hybrid_guide_path = HYBRID_GUIDE_PATH
+    style_guide_path = STYLE_GUIDE_PATH
+    hybrid_exists, standard_exists = _guide_status()
     
-    if hybrid_guide_path.exists():
+    if hybrid_exists:
         guide_type = "混合风格指南"
         guide_info = "官方规则 + 历史经验规则"
         guide_color = "success"
-    elif style_guide_path.exists():
+    elif standard_exists:
         guide_type = "标准风格指南"
         guide_info = "基于论文分析的历史经验规则"
         guide_color = "info"
@@ -988,30 +1256,19 @@ def system_status_interface():
     
     with col3:
         # 显示分析论文数量
-        if hybrid_guide_path.exists():
-            try:
-                with open(hybrid_guide_path, 'r', encoding='utf-8') as f:
-                    guide_data = json.load(f)
-                paper_count = 80  # 混合指南基于80篇论文
-                st.write(f"📚 **分析论文数**: {paper_count}")
-            except:
-                st.write(f"📚 **分析论文数**: 未知")
-        elif style_guide_path.exists():
-            try:
-                with open(style_guide_path, 'r', encoding='utf-8') as f:
-                    guide_data = json.load(f)
-                paper_count = guide_data.get('total_papers_analyzed', 0)
-                st.write(f"📚 **分析论文数**: {paper_count}")
-            except:
-                st.write(f"📚 **分析论文数**: 未知")
+        if hybrid_exists:
+            paper_count = _get_paper_count(hybrid_guide_path, "hybrid")
+        elif standard_exists:
+            paper_count = _get_paper_count(style_guide_path, "standard")
         else:
-            st.write(f"📚 **分析论文数**: 0")
+            paper_count = 0
+        st.write(f"📚 **分析论文数**: {'未知' if paper_count is None else paper_count}")
     
     # 配置状态
     st.markdown("### 🔧 配置状态")
     
     try:
-        Config.validate()
+        ai_config = validate_config()
         st.success("✅ 配置验证通过")
         
         col1, col2 = st.columns(2)
@@ -1020,7 +1277,7 @@ def system_status_interface():
             st.write(f"**批次大小**: {Config.BATCH_SIZE}")
             st.write(f"**最大论文数**: {Config.MAX_PAPERS}")
             st.write(f"**AI提供商**: {Config.AI_PROVIDER.upper()}")
-            st.write(f"**AI模型**: {Config.get_ai_config()['model']}")
+            st.write(f"**AI模型**: {ai_config['model']}")
         
         with col2:
             st.write(f"**高频规则阈值**: {Config.FREQUENT_RULE_THRESHOLD:.1%}")
@@ -1046,16 +1303,9 @@ def system_status_interface():
     # 数据目录状态
     st.markdown("### 📁 数据目录状态")
     
-    data_dirs = [
-        ("期刊PDF", Config.JOURNALS_DIR),
-        ("提取文本", Config.EXTRACTED_DIR),
-        ("单篇报告", Config.INDIVIDUAL_REPORTS_DIR),
-        ("批次汇总", Config.BATCH_SUMMARIES_DIR)
-    ]
-    
-    for name, dir_path in data_dirs:
-        if Path(dir_path).exists():
-            file_count = len(list(Path(dir_path).glob('*')))
+    for name, dir_path in STATUS_DATA_DIRS:
+        file_count = count_dir_entries(dir_path)
+        if file_count >= 0:
             st.success(f"✅ {name}: {file_count} 个文件")
         else:
             st.warning(f"⚠️ {name}: 目录不存在")
@@ -1063,97 +1313,134 @@ def system_status_interface():
     # 文件状态
     st.markdown("### 📄 重要文件状态")
     
-    important_files = [
-        ("混合风格指南JSON", "data/hybrid_style_guide.json"),
-        ("混合风格指南MD", "data/hybrid_style_guide.md"),
-        ("分析日志", Config.ANALYSIS_LOG)
-    ]
-    
-    for name, file_path in important_files:
-        if Path(file_path).exists():
-            file_size = Path(file_path).stat().st_size
+    for name, file_path in STATUS_IMPORTANT_FILES:
+        file_size = get_file_size(file_path)
+        if file_size is not None:
             st.success(f"✅ {name}: {file_size:,} 字节")
         else:
             st.warning(f"⚠️ {name}: 文件不存在")
 
 
+# 日志级别配色（未列出的级别使用灰色）
+LOG_LEVEL_COLORS = {
+    'ERROR': '#ff4444',
+    'WARNING': '#ffaa00',
+    'INFO': '#4488ff',
+    'DEBUG': '#44ff44'
+}
+LOGGER_TOP_N = 10
+
+def _sorted_counts(counts, top_n=None):
+    """按数量从多到少排序，返回 (名称元组, 数量元组)，可只保留前 top_n 项"""
+    items = sorted(counts.items(), key=lambda kv: -kv[1])[:top_n]
+    if not items:
+        return (), ()
+    names, values = zip(*items)
+    return names, values
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _log_level_bar_figure(levels, counts):
+    """构建日志级别分布柱状图（参数需为元组以便缓存，计数不变时直接复用）"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Bar(
+        x=levels,
+        y=counts,
+        marker_color=[LOG_LEVEL_COLORS.get(level, '#888888') for level in levels]
+    ))
+    fig.update_layout(title="日志级别分布", showlegend=False)
+    return fig.to_dict()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _log_level_pie_figure(levels, counts):
+    """构建日志级别占比饼图（参数需为元组以便缓存）"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Pie(
+        labels=levels,
+        values=counts,
+        marker_colors=[LOG_LEVEL_COLORS.get(level, '#888888') for level in levels]
+    ))
+    fig.update_layout(title="日志级别占比")
+    return fig.to_dict()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _logger_bar_figure(names, counts):
+    """构建日志器分布横向柱状图（数量最多的在最上方；参数需为元组以便缓存）"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Bar(
+        x=counts,
+        y=names,
+        orientation='h',
+        marker=dict(color=counts, colorscale='Blues', showscale=True)
+    ))
+    fig.update_layout(title="日志器分布", height=400, yaxis=dict(autorange='reversed'))
+    return fig.to_dict()
+
+def _log_table(entries, with_level=False):
+    """以单个表格展示日志条目（时间、[级别、]日志器、消息、行号）"""
+    st.dataframe(
+        [
+            {
+                "时间": entry['timestamp'][:19],
+                **({"级别": entry['level']} if with_level else {}),
+                "日志器": entry['logger_name'],
+                "消息": entry['message'],
+                "行号": entry['line_number']
+            }
+            for entry in entries
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
+
+@st.fragment
 def log_management_interface():
     """日志管理界面"""
-    st.markdown('<div class="section-header">📋 日志管理</div>', unsafe_allow_html=True)
+    st.markdown(HDR_LOGS, unsafe_allow_html=True)
     
-    # 获取日志摘要
+    # 获取日志摘要（日志文件未变化时各查询直接复用缓存结果）
     try:
-        log_summary = get_log_summary()
+        signature = log_signature()
+        log_scan, log_files = cached_log_overview(signature)
+        log_summary = log_scan["summary"]
         
         # 显示日志统计信息
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("总日志条目", log_summary["total_entries"])
-        
-        with col2:
-            st.metric("错误数量", log_summary["error_count"], delta=None)
-        
-        with col3:
-            st.metric("警告数量", log_summary["warning_count"], delta=None)
-        
-        with col4:
-            st.metric("日志文件大小", f"{log_summary['file_size_kb']} KB")
+        _metrics_row((
+            ("总日志条目", log_summary["total_entries"]),
+            ("错误数量", log_summary["error_count"]),
+            ("警告数量", log_summary["warning_count"]),
+            ("日志文件大小", f"{log_summary['file_size_kb']} KB"),
+        ))
         
         # 日志级别分布
         if log_summary["level_distribution"]:
             st.subheader("📊 日志级别分布")
-            level_data = log_summary["level_distribution"]
+            levels, level_counts = _sorted_counts(log_summary["level_distribution"])
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # 柱状图
-                fig = px.bar(
-                    x=list(level_data.keys()),
-                    y=list(level_data.values()),
-                    title="日志级别分布",
-                    color=list(level_data.keys()),
-                    color_discrete_map={
-                        'ERROR': '#ff4444',
-                        'WARNING': '#ffaa00', 
-                        'INFO': '#4488ff',
-                        'DEBUG': '#44ff44'
-                    }
-                )
-                fig.update_layout(showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+                fig = _log_level_bar_figure(levels, level_counts)
+                st.plotly_chart(fig, use_container_width=True, config=STATIC_PLOT_CONFIG)
             
             with col2:
                 # 饼图
-                fig = px.pie(
-                    values=list(level_data.values()),
-                    names=list(level_data.keys()),
-                    title="日志级别占比",
-                    color_discrete_map={
-                        'ERROR': '#ff4444',
-                        'WARNING': '#ffaa00',
-                        'INFO': '#4488ff', 
-                        'DEBUG': '#44ff44'
-                    }
-                )
+                fig = _log_level_pie_figure(levels, level_counts)
                 st.plotly_chart(fig, use_container_width=True)
         
         # 日志器分布
         if log_summary["logger_distribution"]:
-            st.subheader("📝 日志器分布 (前10)")
-            logger_data = log_summary["logger_distribution"]
+            st.subheader(f"📝 日志器分布 (前{LOGGER_TOP_N})")
+            logger_names, logger_counts = _sorted_counts(log_summary["logger_distribution"], LOGGER_TOP_N)
             
-            fig = px.bar(
-                x=list(logger_data.values()),
-                y=list(logger_data.keys()),
-                orientation='h',
-                title="日志器分布",
-                color=list(logger_data.values()),
-                color_continuous_scale='Blues'
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _logger_bar_figure(logger_names, logger_counts)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_PLOT_CONFIG)
+            logger_total = log_summary.get("logger_total", len(logger_names))
+            if logger_total > len(logger_names):
+                st.caption(f"共 {logger_total} 个日志器，仅显示条目最多的 {len(logger_names)} 个")
         
         # 日志查询功能
         st.subheader("🔍 日志查询")
@@ -1166,17 +1453,15 @@ def log_management_interface():
         
         with query_col2:
             if st.button("🔍 搜索日志", type="primary"):
-                if search_keyword:
+                keyword = search_keyword.strip()
+                if keyword:
                     with st.spinner("正在搜索日志..."):
-                        search_results = search_logs_by_keyword(search_keyword, search_limit)
+                        search_results = cached_search_logs(signature, keyword, int(search_limit))
                     
                     if search_results:
                         st.success(f"找到 {len(search_results)} 条匹配的日志")
                         
-                        for entry in search_results:
-                            with st.expander(f"[{entry['timestamp'][:19]}] {entry['level']} - {entry['logger_name']}"):
-                                st.text(f"消息: {entry['message']}")
-                                st.text(f"行号: {entry['line_number']}")
+                        _log_table(search_results, with_level=True)
                     else:
                         st.warning("没有找到匹配的日志")
                 else:
@@ -1190,12 +1475,9 @@ def log_management_interface():
             if st.button("刷新错误日志"):
                 st.rerun()
             
-            errors = get_recent_errors(10)
+            errors = log_scan["errors"]
             if errors:
-                for error in errors:
-                    with st.expander(f"[{error['timestamp'][:19]}] {error['logger_name']}"):
-                        st.error(error['message'])
-                        st.text(f"行号: {error['line_number']}")
+                _log_table(errors)
             else:
                 st.success("没有错误日志")
         
@@ -1204,22 +1486,18 @@ def log_management_interface():
             if st.button("刷新警告日志"):
                 st.rerun()
             
-            warnings = get_recent_warnings(10)
+            warnings = log_scan["warnings"]
             if warnings:
-                for warning in warnings:
-                    with st.expander(f"[{warning['timestamp'][:19]}] {warning['logger_name']}"):
-                        st.warning(warning['message'])
-                        st.text(f"行号: {warning['line_number']}")
+                _log_table(warnings)
             else:
                 st.success("没有警告日志")
         
         # 日志文件信息
         st.subheader("📁 日志文件信息")
         
-        log_files = get_log_files_info()
         if log_files:
             for file_info in log_files:
-                modified_time = datetime.fromtimestamp(file_info['modified_time']).strftime('%Y-%m-%d %H:%M:%S')
+                modified_time = datetime.fromtimestamp(file_info['modified_time']).isoformat(sep=' ', timespec='seconds')
                 st.info(f"📄 {file_info['name']} - {file_info['size_kb']} KB - 修改时间: {modified_time}")
         else:
             st.warning("没有找到日志文件")
@@ -2,6 +2,7 @@
 配置文件 - 论文风格分析与润色系统
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # 加载环境变量
@@ -36,6 +37,12 @@ class Config:
     BATCH_SIZE = int(os.getenv('BATCH_SIZE', '10'))  # 每批分析的论文数量
     MAX_PAPERS = int(os.getenv('MAX_PAPERS', '100'))  # 最大论文数量
     
+    # 润色配置
+    POLISH_MAX_WORKERS = int(os.getenv('POLISH_MAX_WORKERS', '4'))  # 按段落并行润色的最大并发数
+    
+    # Web界面配置
+    MAX_UPLOAD_SIZE_MB = int(os.getenv('MAX_UPLOAD_SIZE_MB', '10'))  # 上传文件大小上限(MB)
+    
     # 规则分类阈值 (基于并集思维)
     FREQUENT_RULE_THRESHOLD = float(os.getenv('FREQUENT_RULE_THRESHOLD', '0.6'))  # 高频规则 (60%+)
     COMMON_RULE_THRESHOLD = float(os.getenv('COMMON_RULE_THRESHOLD', '0.3'))      # 常见规则 (30%-60%)
@@ -53,6 +60,8 @@ class Config:
     INDIVIDUAL_REPORTS_DIR = os.path.join(DATA_DIR, 'individual_reports')
     BATCH_SUMMARIES_DIR = os.path.join(DATA_DIR, 'batch_summaries')
     OFFICIAL_GUIDES_DIR = os.path.join(DATA_DIR, 'official_guides')
+    DATA_DIRS = (DATA_DIR, JOURNALS_DIR, EXTRACTED_DIR, INDIVIDUAL_REPORTS_DIR,
+                 BATCH_SUMMARIES_DIR, OFFICIAL_GUIDES_DIR)
     
     # 输出文件
     STYLE_GUIDE_JSON = os.path.join(DATA_DIR, 'style_guide.json')
@@ -89,9 +98,10 @@ class Config:
     HYBRID_STYLE_GUIDE_MD = os.path.join(DATA_DIR, 'hybrid_style_guide.md')
     
     @classmethod
+    @lru_cache(maxsize=8)
     def get_ai_config(cls, task_type: str = 'default'):
         """
-        获取当前AI配置
+        获取当前AI配置（按任务类型缓存，配置在运行期间不变；返回的字典为共享对象，请勿修改）
         
         Args:
             task_type: 任务类型
@@ -132,8 +142,9 @@ class Config:
             }
     
     @classmethod
+    @lru_cache(maxsize=1)
     def validate(cls):
-        """验证配置"""
+        """验证配置（每个进程只执行一次，重复调用直接返回；修改API相关配置后需调用 Config.validate.cache_clear()）"""
         ai_config = cls.get_ai_config()
         
         # 检查API Key
@@ -144,11 +155,7 @@ class Config:
             print(f"   Base URL: {ai_config['base_url']}")
         
         # 确保目录存在
-        os.makedirs(cls.DATA_DIR, exist_ok=True)
-        os.makedirs(cls.JOURNALS_DIR, exist_ok=True)
-        os.makedirs(cls.EXTRACTED_DIR, exist_ok=True)
-        os.makedirs(cls.INDIVIDUAL_REPORTS_DIR, exist_ok=True)
-        os.makedirs(cls.BATCH_SUMMARIES_DIR, exist_ok=True)
-        os.makedirs(cls.OFFICIAL_GUIDES_DIR, exist_ok=True)
+        for dir_path in cls.DATA_DIRS:
+            os.makedirs(dir_path, exist_ok=True)
         
         return True
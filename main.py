@@ -5,29 +5,53 @@
 """
 
 import click
-import json
 import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 from datetime import datetime
 
-# 添加src目录到路径
-sys.path.append(str(Path(__file__).parent / 'src'))
-
+# 项目模块统一以 src 包路径导入（项目根目录即脚本所在目录，已在 sys.path 中）
+# 分析器、润色器、PDF提取器等较重的模块在各命令内部按需导入，避免 --help 等轻量命令的启动开销
 from config import Config
-from src.core.pymupdf_extractor import PyMuPDFExtractor
-from src.analysis.incremental_analyzer import IncrementalAnalyzer
-from src.analysis.layered_analyzer import LayeredAnalyzer
-from src.polishing.multi_round_polisher import MultiRoundPolisher
-from src.analysis.quality_scorer import QualityScorer
-from src.analysis.style_guide_generator import StyleGuideGenerator
+from src.utils.json_utils import count_json_items, dump_json, load_guide_preview, load_json, load_json_fields
 
 # 设置日志
 from src.utils.logger_config import setup_logging, get_logger
 setup_logging()
 logger = get_logger(__name__)
 
+# 批次汇总文件名中的批次编号
+BATCH_NUMBER_PATTERN = re.compile(r'batch_(\d+)')
+
+# 加载批次汇总文件的线程数
+BATCH_LOAD_WORKERS = 8
+
+# 各命令反复检查的数据文件路径（模块加载时创建一次）
+STYLE_GUIDE_PATH = Path(Config.STYLE_GUIDE_JSON)
+HYBRID_GUIDE_PATH = Path(Config.HYBRID_STYLE_GUIDE_JSON)
+ANALYSIS_LOG_PATH = Path(Config.ANALYSIS_LOG)
+
+# status 命令检查的数据目录
+STATUS_DATA_DIRS = (
+    Config.JOURNALS_DIR,
+    Config.EXTRACTED_DIR,
+    Config.INDIVIDUAL_REPORTS_DIR,
+    Config.BATCH_SUMMARIES_DIR,
+)
+
+
+def _batch_sort_key(path):
+    """批次文件排序键：有编号的按编号数值排序，其余按文件名排在最后"""
+    match = BATCH_NUMBER_PATTERN.match(path.name)
+    if match:
+        return (0, int(match.group(1)), path.name)
+    return (1, 0, path.name)
+
+
 @click.group()
 def cli():
     """论文风格分析与润色系统"""
@@ -48,6 +72,8 @@ def analyze(input, output, batch_size, max_papers, resume):
     click.echo("🔍 开始期刊论文风格分析...")
     
     try:
+        from src.analysis.incremental_analyzer import IncrementalAnalyzer
+        
         # 验证配置
         Config.validate()
         
@@ -70,22 +96,24 @@ def analyze(input, output, batch_size, max_papers, resume):
             sys.exit(1)
         
         # 显示结果摘要
-        click.echo("\n📊 分析结果摘要:")
-        click.echo(f"  总论文数: {result.get('total_papers', 0)}")
-        click.echo(f"  完成批次数: {len(result.get('batches', []))}")
-        click.echo(f"  是否提前停止: {'是' if result.get('early_stop') else '否'}")
-        click.echo(f"  分析时长: {result.get('end_time', '未知')}")
+        lines = ["\n📊 分析结果摘要:"]
+        lines.append(f"  总论文数: {result.get('total_papers', 0)}")
+        lines.append(f"  完成批次数: {len(result.get('batches', []))}")
+        lines.append(f"  是否提前停止: {'是' if result.get('early_stop') else '否'}")
+        lines.append(f"  分析时长: {result.get('end_time', '未知')}")
         
         # 检查最终风格指南
         final_guide = result.get('final_guide', {})
         if 'rules' in final_guide:
-            click.echo(f"  生成规则数: {len(final_guide['rules'])}")
-            core_rules = len([r for r in final_guide['rules'] if r.get('rule_type') == 'core'])
-            optional_rules = len([r for r in final_guide['rules'] if r.get('rule_type') == 'optional'])
-            click.echo(f"  核心规则: {core_rules} 条")
-            click.echo(f"  可选规则: {optional_rules} 条")
+            lines.append(f"  生成规则数: {len(final_guide['rules'])}")
+            rule_type_counts = Counter(r.get('rule_type') for r in final_guide['rules'])
+            core_rules = rule_type_counts['core']
+            optional_rules = rule_type_counts['optional']
+            lines.append(f"  核心规则: {core_rules} 条")
+            lines.append(f"  可选规则: {optional_rules} 条")
         
-        click.echo(f"\n✅ 风格指南已保存到: {output}")
+        lines.append(f"\n✅ 风格指南已保存到: {output}")
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"❌ 分析过程中出现错误: {str(e)}", err=True)
@@ -97,46 +125,36 @@ def analyze(input, output, batch_size, max_papers, resume):
               help='最大分析论文数量，不指定则分析所有')
 @click.option('--resume', is_flag=True, help='从上次中断的地方继续分析')
 @click.option('--progress', is_flag=True, help='显示分析进度')
-def analyze_individual(max_papers, resume, progress):
+@click.option('--pretty', is_flag=True, help='分析摘要保存为带缩进的JSON（默认保存为紧凑的gzip压缩JSON）')
+def analyze_individual(max_papers, resume, progress, pretty):
     """分析所有单个PDF文件（独立于批量分析）"""
     click.echo("🔍 开始分析所有单个PDF文件...")
     
     try:
+        from src.analysis.layered_analyzer import LayeredAnalyzer
+        
         # 验证配置
         Config.validate()
         
         # 创建分析器（单篇分析使用deepseek-reasoner）
         analyzer = LayeredAnalyzer(task_type='individual')
         
-        # 显示进度（如果启用）
-        if progress:
-            import threading
-            import time
-            
-            def show_progress():
-                while True:
-                    progress_info = analyzer.get_analysis_progress()
-                    if progress_info['total_files'] > 0:
-                        completed = progress_info['completed_files']
-                        total = progress_info['total_files']
-                        current = progress_info['current_file']
-                        failed = progress_info['failed_files']
-                        
-                        click.echo(f"\r📊 进度: {completed}/{total} 完成, {failed} 失败 | 当前: {current}", nl=False)
-                        
-                        if completed + failed >= total:
-                            break
-                    time.sleep(5)
-            
-            # 启动进度显示线程
-            progress_thread = threading.Thread(target=show_progress, daemon=True)
-            progress_thread.start()
+        # 显示进度（如果启用）：由分析器在每个文件开始/结束时回调，无需轮询
+        def show_progress(progress_info):
+            completed = progress_info['completed_files']
+            total = progress_info['total_files']
+            current = progress_info['current_file']
+            failed = progress_info['failed_files']
+            click.echo(f"\r📊 进度: {completed}/{total} 完成, {failed} 失败 | 当前: {current}", nl=False)
         
         # 开始分析
         result = analyzer.analyze_all_individual_papers(
             max_papers=max_papers,
-            resume=resume
+            resume=resume,
+            progress_cb=show_progress if progress else None
         )
+        if progress:
+            click.echo()
         
         if 'error' in result:
             click.echo(f"❌ 分析失败: {result['error']}")
@@ -160,10 +178,12 @@ def analyze_individual(max_papers, resume, progress):
             for paper_id in result['failed_papers']:
                 click.echo(f"  - {paper_id}")
         
-        # 保存分析摘要
-        summary_file = Path("data/individual_analysis_summary.json")
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        # 保存分析摘要（默认紧凑格式并gzip压缩，load_json 可直接读取 .gz 文件）
+        if pretty:
+            summary_file = Path("data/individual_analysis_summary.json")
+        else:
+            summary_file = Path("data/individual_analysis_summary.json.gz")
+        dump_json(result, summary_file, pretty=pretty)
         
         click.echo(f"💾 分析摘要已保存到: {summary_file}")
         
@@ -183,6 +203,8 @@ def polish(text, file, interactive, output):
     click.echo("✨ 开始论文润色...")
     
     try:
+        from src.polishing.multi_round_polisher import MultiRoundPolisher
+        
         # 验证配置
         Config.validate()
         
@@ -190,17 +212,17 @@ def polish(text, file, interactive, output):
         if text:
             paper_text = text
         elif file:
-            if not Path(file).exists():
+            file_path = Path(file)
+            if not file_path.exists():
                 click.echo(f"❌ 文件不存在: {file}", err=True)
                 sys.exit(1)
-            with open(file, 'r', encoding='utf-8') as f:
-                paper_text = f.read()
+            paper_text = file_path.read_text(encoding='utf-8')
         else:
             click.echo("❌ 请提供论文文本 (-t) 或文件路径 (-f)", err=True)
             sys.exit(1)
         
         # 检查风格指南是否存在
-        if not Path(Config.STYLE_GUIDE_JSON).exists():
+        if not STYLE_GUIDE_PATH.exists():
             click.echo("❌ 风格指南不存在，请先运行分析命令", err=True)
             click.echo("   运行: python main.py analyze", err=True)
             sys.exit(1)
@@ -216,26 +238,29 @@ def polish(text, file, interactive, output):
             sys.exit(1)
         
         # 显示结果
-        click.echo("\n📈 润色结果:")
-        before_score = result.get('before_scores', {}).get('overall_score', 0)
-        after_score = result.get('after_scores', {}).get('overall_score', 0)
-        improvement = result.get('score_comparison', {}).get('overall_improvement', 0)
-        
-        click.echo(f"  润色前总分: {before_score:.1f}")
-        click.echo(f"  润色后总分: {after_score:.1f}")
-        click.echo(f"  改进幅度: +{improvement:.1f} 分")
+        lines = ["\n📈 润色结果:"]
+        before_scores = result.get('before_scores') or {}
+        after_scores = result.get('after_scores') or {}
+        comparison = result.get('score_comparison') or {}
+        before_score = before_scores.get('overall_score', 0)
+        after_score = after_scores.get('overall_score', 0)
+        improvement = comparison.get('overall_improvement', 0)
+        
+        lines.append(f"  润色前总分: {before_score:.1f}")
+        lines.append(f"  润色后总分: {after_score:.1f}")
+        lines.append(f"  改进幅度: +{improvement:.1f} 分")
         
         # 显示各维度改进
-        comparison = result.get('score_comparison', {})
-        click.echo(f"  风格匹配: +{comparison.get('style_improvement', 0):.1f}")
-        click.echo(f"  学术规范: +{comparison.get('academic_improvement', 0):.1f}")
-        click.echo(f"  可读性: +{comparison.get('readability_improvement', 0):.1f}")
+        lines.append(f"  风格匹配: +{comparison.get('style_improvement', 0):.1f}")
+        lines.append(f"  学术规范: +{comparison.get('academic_improvement', 0):.1f}")
+        lines.append(f"  可读性: +{comparison.get('readability_improvement', 0):.1f}")
         
         # 显示修改统计
-        summary = result.get('polishing_summary', {})
-        click.echo(f"\n📝 修改统计:")
-        click.echo(f"  润色轮数: {summary.get('total_rounds', 0)}")
-        click.echo(f"  应用修改: {summary.get('total_modifications_applied', 0)} 处")
+        summary = result.get('polishing_summary') or {}
+        lines.append(f"\n📝 修改统计:")
+        lines.append(f"  润色轮数: {summary.get('total_rounds', 0)}")
+        lines.append(f"  应用修改: {summary.get('total_modifications_applied', 0)} 处")
+        click.echo("\n".join(lines))
         
         # 保存结果
         if output:
@@ -243,12 +268,13 @@ def polish(text, file, interactive, output):
             click.echo(f"\n💾 润色结果已保存到: {output}")
         
         # 显示润色后的文本
-        click.echo("\n📄 润色后的论文:")
-        click.echo("-" * 50)
-        click.echo(result.get('polished_text', ''))
-        click.echo("-" * 50)
+        lines = ["\n📄 润色后的论文:"]
+        lines.append("-" * 50)
+        lines.append(result.get('polished_text', ''))
+        lines.append("-" * 50)
         
-        click.echo("\n✅ 论文润色完成!")
+        lines.append("\n✅ 论文润色完成!")
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"❌ 润色过程中出现错误: {str(e)}", err=True)
@@ -263,6 +289,8 @@ def score(text, file):
     click.echo("📊 开始论文质量评估...")
     
     try:
+        from src.analysis.quality_scorer import QualityScorer
+        
         # 验证配置
         Config.validate()
         
@@ -270,11 +298,11 @@ def score(text, file):
         if text:
             paper_text = text
         elif file:
-            if not Path(file).exists():
+            file_path = Path(file)
+            if not file_path.exists():
                 click.echo(f"❌ 文件不存在: {file}", err=True)
                 sys.exit(1)
-            with open(file, 'r', encoding='utf-8') as f:
-                paper_text = f.read()
+            paper_text = file_path.read_text(encoding='utf-8')
         else:
             click.echo("❌ 请提供论文文本 (-t) 或文件路径 (-f)", err=True)
             sys.exit(1)
@@ -290,34 +318,35 @@ def score(text, file):
             sys.exit(1)
         
         # 显示评分结果
-        click.echo("\n📈 质量评分结果:")
-        click.echo(f"  总分: {scores.get('overall_score', 0):.1f}/100")
+        lines = ["\n📈 质量评分结果:"]
+        lines.append(f"  总分: {scores.get('overall_score', 0):.1f}/100")
         
-        style_score = scores.get('style_match', {}).get('score', 0)
-        academic_score = scores.get('academic_standard', {}).get('score', 0)
-        readability_score = scores.get('readability', {}).get('score', 0)
+        style_score = (scores.get('style_match') or {}).get('score', 0)
+        academic_score = (scores.get('academic_standard') or {}).get('score', 0)
+        readability_score = (scores.get('readability') or {}).get('score', 0)
         
-        click.echo(f"  风格匹配: {style_score:.1f}/100")
-        click.echo(f"  学术规范: {academic_score:.1f}/100")
-        click.echo(f"  可读性: {readability_score:.1f}/100")
+        lines.append(f"  风格匹配: {style_score:.1f}/100")
+        lines.append(f"  学术规范: {academic_score:.1f}/100")
+        lines.append(f"  可读性: {readability_score:.1f}/100")
         
         # 显示详细分析
         detailed = scores.get('detailed_analysis', {})
         if detailed:
             basic_stats = detailed.get('basic_stats', {})
-            click.echo(f"\n📝 基础统计:")
-            click.echo(f"  字数: {basic_stats.get('word_count', 0)}")
-            click.echo(f"  句数: {basic_stats.get('sentence_count', 0)}")
-            click.echo(f"  平均句长: {basic_stats.get('avg_words_per_sentence', 0):.1f} 词")
+            lines.append(f"\n📝 基础统计:")
+            lines.append(f"  字数: {basic_stats.get('word_count', 0)}")
+            lines.append(f"  句数: {basic_stats.get('sentence_count', 0)}")
+            lines.append(f"  平均句长: {basic_stats.get('avg_words_per_sentence', 0):.1f} 词")
         
         # 显示建议
         recommendations = scores.get('recommendations', [])
         if recommendations:
-            click.echo(f"\n💡 改进建议:")
+            lines.append(f"\n💡 改进建议:")
             for i, rec in enumerate(recommendations, 1):
-                click.echo(f"  {i}. {rec}")
+                lines.append(f"  {i}. {rec}")
         
-        click.echo("\n✅ 质量评估完成!")
+        lines.append("\n✅ 质量评估完成!")
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"❌ 评估过程中出现错误: {str(e)}", err=True)
@@ -330,42 +359,39 @@ def status():
     click.echo("📊 系统状态检查...")
     
     try:
+        from src.core.pymupdf_extractor import PyMuPDFExtractor
+        
         # 检查配置
         Config.validate()
         click.echo("✅ 配置验证通过")
         
         # 检查数据目录
-        data_dirs = [
-            Config.JOURNALS_DIR,
-            Config.EXTRACTED_DIR,
-            Config.INDIVIDUAL_REPORTS_DIR,
-            Config.BATCH_SUMMARIES_DIR
-        ]
-        
-        for dir_path in data_dirs:
-            if Path(dir_path).exists():
-                file_count = len(list(Path(dir_path).glob('*')))
-                click.echo(f"✅ {dir_path}: {file_count} 个文件")
-            else:
+        for dir_path in STATUS_DATA_DIRS:
+            try:
+                # os.scandir 逐项计数，不为每个条目创建Path对象
+                with os.scandir(dir_path) as entries:
+                    file_count = sum(1 for _ in entries)
+            except FileNotFoundError:
                 click.echo(f"❌ {dir_path}: 目录不存在")
+            else:
+                click.echo(f"✅ {dir_path}: {file_count} 个文件")
         
         # 检查混合风格指南
-        hybrid_guide_path = Path('data/hybrid_style_guide.json')
-        if hybrid_guide_path.exists():
-            with open(hybrid_guide_path, 'r', encoding='utf-8') as f:
-                guide = json.load(f)
-            rules_count = guide.get('total_rules', 0)
-            official_count = guide.get('official_rules_count', 0)
-            empirical_count = guide.get('empirical_rules_count', 0)
+        if HYBRID_GUIDE_PATH.exists():
+            # 只流式读取三个计数字段，不解析完整的规则列表
+            counts = load_json_fields(
+                HYBRID_GUIDE_PATH, ('total_rules', 'official_rules_count', 'empirical_rules_count')
+            )
+            rules_count = counts.get('total_rules', 0)
+            official_count = counts.get('official_rules_count', 0)
+            empirical_count = counts.get('empirical_rules_count', 0)
             click.echo(f"✅ 混合风格指南: {rules_count} 条规则 (官方: {official_count}, 经验: {empirical_count})")
         else:
             click.echo("❌ 混合风格指南: 不存在")
         
         # 检查分析日志
-        if Path(Config.ANALYSIS_LOG).exists():
-            with open(Config.ANALYSIS_LOG, 'r', encoding='utf-8') as f:
-                log = json.load(f)
-            batches_count = len(log.get('batches', []))
+        if ANALYSIS_LOG_PATH.exists():
+            batches_count = count_json_items(ANALYSIS_LOG_PATH, 'batches')
             click.echo(f"✅ 分析日志: {batches_count} 个批次")
         else:
             click.echo("❌ 分析日志: 不存在")
@@ -387,16 +413,31 @@ def status():
               help='期刊PDF文件目录')
 @click.option('--output', '-o', default=Config.EXTRACTED_DIR,
               help='提取文本输出目录')
-def extract(input, output):
+@click.option('--workers', '-w', default=None, type=int,
+              help='并行提取的进程数，默认 min(CPU核数, 6)，1 表示串行')
+@click.option('--backend', type=click.Choice(['pymupdf']), default='pymupdf',
+              help='PDF解析后端（目前仅支持PyMuPDF）')
+def extract(input, output, workers, backend):
     """提取PDF文本"""
     click.echo("📄 开始PDF文本提取...")
     
+    # 在启动进程池前确认 PyMuPDF 可用，否则每个工作进程都会逐个文件报同样的导入错误
     try:
-        # 使用PyMuPDF提取器
-        extractor = PyMuPDFExtractor(input, output)
+        import fitz  # noqa: F401
+    except ImportError:
+        click.echo("❌ 未安装 PyMuPDF，无法提取PDF文本", err=True)
+        click.echo("   运行: pip install PyMuPDF", err=True)
+        sys.exit(1)
+    
+    try:
+        from src.core.pymupdf_extractor import PyMuPDFExtractor
+        
+        # 使用PyMuPDF提取器（文本提取比pypdf/pdfminer快一个数量级，新增后端需有同等性能）
+        extractor_classes = {'pymupdf': PyMuPDFExtractor}
+        extractor = extractor_classes[backend](input, output)
         
-        # 执行提取
-        results = extractor.extract_all_pdfs()
+        # 执行提取（多进程并行）
+        results = extractor.extract_all_pdfs_parallel(num_workers=workers)
         
         if results.get('success') is False:
             click.echo(f"❌ 提取失败: {results.get('message', '未知错误')}", err=True)
@@ -409,14 +450,8 @@ def extract(input, output):
         click.echo(f"  提取失败: {results.get('failed_extractions', 0)}")
         click.echo(f"  总字符数: {results.get('total_characters', 0):,}")
         
-        # 显示布局分析结果
-        if 'extraction_details' in results:
-            two_column_files = 0
-            for detail in results['extraction_details']:
-                if detail.get('success') and 'layout_info' in detail:
-                    if detail['layout_info'].get('is_two_column', False):
-                        two_column_files += 1
-            click.echo(f"  双栏布局文件: {two_column_files}")
+        # 显示布局分析结果（提取时已统计）
+        click.echo(f"  双栏布局文件: {results.get('two_column_count', 0)}")
         
         click.echo(f"\n✅ 文本提取完成，结果保存到: {output}")
         
@@ -432,14 +467,13 @@ def guide():
     
     try:
         # 检查风格指南是否存在
-        if not Path(Config.STYLE_GUIDE_JSON).exists():
+        if not STYLE_GUIDE_PATH.exists():
             click.echo("❌ 风格指南不存在，请先运行分析命令", err=True)
             click.echo("   运行: python main.py analyze", err=True)
             sys.exit(1)
         
-        # 加载风格指南
-        with open(Config.STYLE_GUIDE_JSON, 'r', encoding='utf-8') as f:
-            guide = json.load(f)
+        # 只读取预览所需的部分（安装了 ijson 时流式解析，不构建完整规则列表）
+        guide = load_guide_preview(STYLE_GUIDE_PATH, core_limit=5)
         
         # 显示摘要
         click.echo(f"\n📊 风格指南摘要:")
@@ -453,22 +487,21 @@ def guide():
         click.echo(f"  可选规则: {rule_summary.get('optional_rules', 0)}")
         
         # 显示核心规则
-        rules = guide.get('rules', [])
-        core_rules = [r for r in rules if r.get('rule_type') == 'core']
+        core_rules = guide['core_rules']
         
         if core_rules:
             click.echo(f"\n🎯 核心规则 (前5条):")
-            for i, rule in enumerate(core_rules[:5], 1):
+            for i, rule in enumerate(core_rules, 1):
                 click.echo(f"  {i}. {rule.get('description', '')}")
                 click.echo(f"     遵循率: {rule.get('frequency', 0):.1%}")
                 click.echo()
         
         # 显示类别
-        categories = guide.get('categories', {})
-        if categories:
+        category_counts = guide['category_counts']
+        if category_counts:
             click.echo(f"\n📂 规则类别:")
-            for category, category_rules in categories.items():
-                click.echo(f"  {category}: {len(category_rules)} 条规则")
+            for category, rules_count in category_counts.items():
+                click.echo(f"  {category}: {rules_count} 条规则")
         
         click.echo(f"\n💡 完整风格指南请查看: {Config.STYLE_GUIDE_MD}")
         
@@ -492,8 +525,6 @@ def integrate_guide(official_guide, output, validate, force_refresh):
         from src.core.official_guide_parser import OfficialGuideParser
         from src.analysis.style_guide_generator import StyleGuideGenerator
         from src.analysis.rule_validator import RuleValidator
-        import json
-        from pathlib import Path
         
         # 1. 解析官方指南
         parser = OfficialGuideParser()
@@ -520,9 +551,8 @@ def integrate_guide(official_guide, output, validate, force_refresh):
         generator = StyleGuideGenerator()
         empirical_data = None
         
-        if Path(Config.STYLE_GUIDE_JSON).exists():
-            with open(Config.STYLE_GUIDE_JSON, 'r', encoding='utf-8') as f:
-                empirical_data = json.load(f)
+        if STYLE_GUIDE_PATH.exists():
+            empirical_data = load_json(STYLE_GUIDE_PATH)
             click.echo("✅ 成功加载经验规则")
         else:
             click.echo("⚠️  未找到往期期刊分析结果，将仅使用官方规则")
@@ -558,8 +588,7 @@ def integrate_guide(official_guide, output, validate, force_refresh):
         output_file = Path(output)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(hybrid_guide, f, ensure_ascii=False, indent=2)
+        dump_json(hybrid_guide, output_file)
         
         # 6. 生成人类可读版本
         markdown_output = output.replace('.json', '.md')
@@ -633,8 +662,6 @@ def generate_guide(input_dir, output):
     try:
         # 导入必要的模块
         from src.analysis.layered_analyzer import LayeredAnalyzer
-        import json
-        from pathlib import Path
         
         # 检查输入目录
         input_path = Path(input_dir)
@@ -642,26 +669,29 @@ def generate_guide(input_dir, output):
             click.echo(f"❌ 输入目录不存在: {input_dir}", err=True)
             sys.exit(1)
         
-        # 收集所有批次汇总文件
-        batch_files = sorted(input_path.glob('batch_*.json'))
+        # 收集所有批次汇总文件（按批次编号自然排序，batch_100 排在 batch_99 之后）
+        with os.scandir(input_path) as entries:
+            batch_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.startswith('batch_') and entry.name.endswith('.json')
+            ]
+        batch_files.sort(key=_batch_sort_key)
         if not batch_files:
             click.echo(f"❌ 在 {input_dir} 中未找到批次汇总文件", err=True)
             sys.exit(1)
         
         click.echo(f"📊 找到 {len(batch_files)} 个批次汇总文件")
         
-        # 加载批次汇总数据
-        batch_summaries = []
-        for batch_file in batch_files:
-            with open(batch_file, 'r', encoding='utf-8') as f:
-                batch_data = json.load(f)
-                batch_summaries.append(batch_data)
-                
-                # 显示批次信息
-                batch_id = batch_data.get('batch_id', batch_file.stem)
-                paper_count = batch_data.get('paper_count', 0)
-                rules_count = len(batch_data.get('comprehensive_rules', []))
-                click.echo(f"  📄 {batch_id}: {paper_count} 篇论文, {rules_count} 条规则")
+        # 加载批次汇总数据（纯 I/O，多线程并发读取；顺序与 batch_files 一致）
+        with ThreadPoolExecutor(max_workers=min(BATCH_LOAD_WORKERS, len(batch_files))) as executor:
+            batch_summaries = list(executor.map(load_json, batch_files))
+        
+        for batch_file, batch_data in zip(batch_files, batch_summaries):
+            # 显示批次信息
+            batch_id = batch_data.get('batch_id', batch_file.stem)
+            paper_count = batch_data.get('paper_count', 0)
+            rules_count = len(batch_data.get('comprehensive_rules', []))
+            click.echo(f"  📄 {batch_id}: {paper_count} 篇论文, {rules_count} 条规则")
         
         # 创建分析器并生成风格指南
         click.echo("🤖 开始全局风格整合...")
@@ -674,13 +704,14 @@ def generate_guide(input_dir, output):
             sys.exit(1)
         
         # 显示结果摘要
+        lines = []
         total_papers = style_guide.get('total_papers_analyzed', 0)
         total_batches = style_guide.get('total_batches', 0)
         
-        click.echo(f"\n🎉 风格指南生成完成!")
-        click.echo(f"📊 处理摘要:")
-        click.echo(f"  批次数: {total_batches}")
-        click.echo(f"  论文数: {total_papers}")
+        lines.append(f"\n🎉 风格指南生成完成!")
+        lines.append(f"📊 处理摘要:")
+        lines.append(f"  批次数: {total_batches}")
+        lines.append(f"  论文数: {total_papers}")
         
         # 显示规则分类详情（3.0版本 - 8大维度）
         dimensions = [
@@ -689,7 +720,7 @@ def generate_guide(input_dir, output):
             'section_patterns', 'citation_artistry'
         ]
         
-        click.echo(f"\n📋 规则分类详情（按维度统计）:")
+        lines.append(f"\n📋 规则分类详情（按维度统计）:")
         total_patterns = 0
         dimension_stats = {}
         
@@ -712,21 +743,20 @@ def generate_guide(input_dir, output):
                     
                     # 格式化维度名称显示
                     dim_display = dimension.replace('_', ' ').title()
-                    click.echo(f"  📌 {dim_display}:")
-                    click.echo(f"    高频模式: {freq_count} 条")
-                    click.echo(f"    常见模式: {common_count} 条")
-                    click.echo(f"    替代模式: {alt_count} 条")
-                    click.echo(f"    小计: {dim_total} 条")
+                    lines.append(f"  📌 {dim_display}:")
+                    lines.append(f"    高频模式: {freq_count} 条")
+                    lines.append(f"    常见模式: {common_count} 条")
+                    lines.append(f"    替代模式: {alt_count} 条")
+                    lines.append(f"    小计: {dim_total} 条")
         
-        click.echo(f"\n📊 总规则数: {total_patterns} 条")
+        lines.append(f"\n📊 总规则数: {total_patterns} 条")
         
-        click.echo(f"\n💾 风格指南已保存到: {output}")
+        lines.append(f"\n💾 风格指南已保存到: {output}")
         
         # 验证文件是否正确生成（3.0版本）
         output_path = Path(output)
         if output_path.exists():
-            with open(output_path, 'r', encoding='utf-8') as f:
-                saved_guide = json.load(f)
+            saved_guide = load_json(output_path)
             
             # 统计保存文件中的规则数量（8大维度）
             dimensions = [
@@ -736,7 +766,7 @@ def generate_guide(input_dir, output):
             ]
             
             saved_total = 0
-            click.echo(f"\n🔍 文件验证详情:")
+            lines.append(f"\n🔍 文件验证详情:")
             
             for dimension in dimensions:
                 dimension_data = saved_guide.get(dimension, {})
@@ -749,11 +779,13 @@ def generate_guide(input_dir, output):
                     if dim_total > 0:
                         saved_total += dim_total
                         dim_display = dimension.replace('_', ' ').title()
-                        click.echo(f"  ✅ {dim_display}: {dim_total} 条模式 (高频:{freq_count}, 常见:{common_count}, 替代:{alt_count})")
+                        lines.append(f"  ✅ {dim_display}: {dim_total} 条模式 (高频:{freq_count}, 常见:{common_count}, 替代:{alt_count})")
             
-            click.echo(f"✅ 验证成功: 文件包含 {saved_total} 条规则")
+            lines.append(f"✅ 验证成功: 文件包含 {saved_total} 条规则")
         else:
-            click.echo("⚠️ 警告: 输出文件未找到")
+            lines.append("⚠️ 警告: 输出文件未找到")
+        
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"❌ 生成过程中出现错误: {str(e)}", err=True)
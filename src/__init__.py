@@ -5,12 +5,16 @@
 提供多轮交互式润色和质量评分功能。
 """
 
-from . import analysis
-from . import polishing
-from . import core
-from . import utils
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "AI Assistant"
 
 __all__ = ["analysis", "polishing", "core", "utils"]
+
+
+def __getattr__(name):
+    """按需导入子包，避免导入 src.log 等轻量模块时连带加载分析依赖"""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,10 +7,7 @@
 - 风格指南生成
 """
 
-from .layered_analyzer import LayeredAnalyzer
-from .incremental_analyzer import IncrementalAnalyzer
-from .style_guide_generator import StyleGuideGenerator
-from .quality_scorer import QualityScorer
+import importlib
 
 __all__ = [
     "LayeredAnalyzer",
@@ -18,3 +15,17 @@ __all__ = [
     "StyleGuideGenerator",
     "QualityScorer",
 ]
+
+_SUBMODULES = {
+    "LayeredAnalyzer": ".layered_analyzer",
+    "IncrementalAnalyzer": ".incremental_analyzer",
+    "StyleGuideGenerator": ".style_guide_generator",
+    "QualityScorer": ".quality_scorer",
+}
+
+
+def __getattr__(name):
+    """按需导入（各分析器依赖不同，导入其中一个时不连带加载其他分析器）"""
+    if name in _SUBMODULES:
+        return getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
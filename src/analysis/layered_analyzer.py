@@ -6,7 +6,7 @@
 
 import json
 import os
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -165,7 +165,10 @@ class LayeredAnalyzer:
             }
 
     def analyze_all_individual_papers(
-        self, max_papers: int = None, resume: bool = False
+        self,
+        max_papers: int = None,
+        resume: bool = False,
+        progress_cb: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
         """
         分析所有单个PDF文件（独立于批量分析）
@@ -173,6 +176,7 @@ class LayeredAnalyzer:
         Args:
             max_papers: 最大分析论文数量，None表示分析所有
             resume: 是否从上次中断的地方继续
+            progress_cb: 进度回调，每个文件开始和结束时以进度信息副本调用（同 get_analysis_progress）
 
         Returns:
             分析结果摘要
@@ -215,6 +219,8 @@ class LayeredAnalyzer:
             for i, (paper_id, paper_text) in enumerate(extracted_files, 1):
                 self.analysis_progress["current_file"] = paper_id
                 logger.info(f"正在分析第 {i}/{len(extracted_files)} 个文件: {paper_id}")
+                if progress_cb:
+                    progress_cb(self.get_analysis_progress())
 
                 try:
                     result = self.analyze_individual_paper(paper_id, paper_text)
@@ -237,6 +243,9 @@ class LayeredAnalyzer:
                     }
                     results.append(error_result)
 
+                if progress_cb:
+                    progress_cb(self.get_analysis_progress())
+
             # 生成分析摘要
             summary = self._generate_analysis_summary(results)
 
@@ -6,16 +6,19 @@
 
 import re
 from typing import Dict, List
-import json
 
 from ..utils.nlp_utils import NLPUtils
 from config import Config
+from ..utils.json_utils import load_json
 
 # 设置日志
 from ..utils.logger_config import get_logger
 
 logger = get_logger(__name__)
 
+EXAMINE_PATTERN = re.compile(r"\bexamine\b")
+INVESTIGATE_PATTERN = re.compile(r"\binvestigate\b")
+
 
 class QualityScorer:
     """质量评分器"""
@@ -24,6 +27,8 @@ class QualityScorer:
         """初始化评分器"""
         self.nlp_utils = NLPUtils()
         self.style_guide = {}
+        # 最近一次评分文本的NLP分析缓存: (文本, {分析类型: 结果})
+        self._analysis_cache = ("", {})
         logger.info("质量评分器初始化完成（纯NLP模式）")
 
     def load_style_guide(self) -> bool:
@@ -34,13 +39,40 @@ class QualityScorer:
             是否加载成功
         """
         try:
-            with open(Config.STYLE_GUIDE_JSON, "r", encoding="utf-8") as f:
-                self.style_guide = json.load(f)
+            self.style_guide = load_json(Config.STYLE_GUIDE_JSON)
             return True
         except Exception as e:
             logger.error(f"加载风格指南失败: {str(e)}")
             return False
 
+    def _get_text_analysis(self, paper_text: str, kind: str) -> Dict:
+        """
+        获取文本的NLP分析结果（同一文本的同类分析只计算一次）
+
+        风格匹配、学术规范、可读性和详细分析会对同一文本重复调用
+        spaCy 分析，这里按文本缓存最近一次的结果。
+
+        Args:
+            paper_text: 论文文本
+            kind: 分析类型 ("sentence", "vocabulary", "academic")
+
+        Returns:
+            对应的分析结果
+        """
+        cached_text, cache = self._analysis_cache
+        if cached_text != paper_text:
+            cache = {}
+            self._analysis_cache = (paper_text, cache)
+
+        if kind not in cache:
+            analyzers = {
+                "sentence": self.nlp_utils.analyze_sentence_structure,
+                "vocabulary": self.nlp_utils.analyze_vocabulary,
+                "academic": self.nlp_utils.analyze_academic_expression,
+            }
+            cache[kind] = analyzers[kind](paper_text)
+        return cache[kind]
+
     def score_paper(self, paper_text: str, style_guide: Dict = None) -> Dict:
         """
         对论文进行质量评分
@@ -123,6 +155,8 @@ class QualityScorer:
             matched_rules = 0
             total_rules = len(rules)
             rule_details = []
+            # 匹配结果只取决于文本和检查类型，同类规则复用一次检查的结果
+            check_results = {}
 
             for rule in rules:
                 rule_id = rule.get("rule_id", "")
@@ -130,7 +164,7 @@ class QualityScorer:
                 description = rule.get("description", "")
 
                 # 简化的规则匹配逻辑
-                is_matched = self._check_rule_match(paper_text, rule)
+                is_matched = self._check_rule_match(paper_text, rule, check_results)
 
                 if is_matched:
                     matched_rules += 1
@@ -191,57 +225,88 @@ class QualityScorer:
             logger.error(f"计算风格匹配度失败: {str(e)}")
             return {"score": 0, "error": str(e)}
 
-    def _check_rule_match(self, paper_text: str, rule: Dict) -> bool:
+    def _classify_rule_check(self, rule: Dict) -> str:
+        """
+        根据规则描述确定需要执行的匹配检查
+
+        Args:
+            rule: 规则定义
+
+        Returns:
+            检查类型
+        """
+        description = rule.get("description", "").lower()
+
+        if "examine" in description and "investigate" in description:
+            return "examine_over_investigate"
+        elif "passive" in description or "voice" in description:
+            return "passive_voice"
+        elif "sentence" in description and "length" in description:
+            return "sentence_length"
+        elif "academic" in description or "vocabulary" in description:
+            return "academic_vocabulary"
+        return "default"
+
+    def _check_rule_match(
+        self, paper_text: str, rule: Dict, check_results: Dict = None
+    ) -> bool:
         """
         检查论文是否匹配特定规则
 
         Args:
             paper_text: 论文文本
             rule: 规则定义
+            check_results: 同一文本已完成的检查结果（可选，按检查类型复用）
 
         Returns:
             是否匹配
         """
-        try:
-            description = rule.get("description", "").lower()
+        check = self._classify_rule_check(rule)
+        if check_results is not None and check in check_results:
+            return check_results[check]
 
+        try:
             # 基于规则描述进行匹配
-            if "examine" in description and "investigate" in description:
+            if check == "examine_over_investigate":
                 # 检查是否使用examine而非investigate
-                examine_count = len(re.findall(r"\bexamine\b", paper_text.lower()))
-                investigate_count = len(
-                    re.findall(r"\binvestigate\b", paper_text.lower())
-                )
-                return examine_count > investigate_count
+                lowered_text = paper_text.lower()
+                examine_count = len(EXAMINE_PATTERN.findall(lowered_text))
+                investigate_count = len(INVESTIGATE_PATTERN.findall(lowered_text))
+                is_matched = examine_count > investigate_count
 
-            elif "passive" in description or "voice" in description:
+            elif check == "passive_voice":
                 # 检查被动语态使用
-                passive_ratio = self.nlp_utils.analyze_academic_expression(
-                    paper_text
+                passive_ratio = self._get_text_analysis(
+                    paper_text, "academic"
                 ).get("passive_voice_ratio", 0)
-                return passive_ratio > 0.1  # 被动语态比例超过10%
+                is_matched = passive_ratio > 0.1  # 被动语态比例超过10%
 
-            elif "sentence" in description and "length" in description:
+            elif check == "sentence_length":
                 # 检查句长
-                sentence_analysis = self.nlp_utils.analyze_sentence_structure(
-                    paper_text
+                sentence_analysis = self._get_text_analysis(
+                    paper_text, "sentence"
                 )
                 avg_length = sentence_analysis.get("avg_sentence_length", 0)
-                return 10 <= avg_length <= 25  # 理想句长范围
+                is_matched = 10 <= avg_length <= 25  # 理想句长范围
 
-            elif "academic" in description or "vocabulary" in description:
+            elif check == "academic_vocabulary":
                 # 检查学术词汇
-                vocab_analysis = self.nlp_utils.analyze_vocabulary(paper_text)
+                vocab_analysis = self._get_text_analysis(paper_text, "vocabulary")
                 academic_ratio = vocab_analysis.get("academic_word_ratio", 0)
-                return academic_ratio > 0.1  # 学术词汇比例超过10%
+                is_matched = academic_ratio > 0.1  # 学术词汇比例超过10%
 
-            # 默认匹配逻辑
-            return True
+            else:
+                # 默认匹配逻辑
+                is_matched = True
 
         except Exception as e:
             logger.error(f"检查规则匹配失败: {str(e)}")
             return False
 
+        if check_results is not None:
+            check_results[check] = is_matched
+        return is_matched
+
     def _calculate_academic_standard_score(self, paper_text: str) -> Dict:
         """
         计算学术规范性评分（基于NLP指标）
@@ -256,9 +321,9 @@ class QualityScorer:
             logger.info("开始基于NLP指标计算学术规范性评分")
             
             # 获取多种NLP分析结果
-            academic_analysis = self.nlp_utils.analyze_academic_expression(paper_text)
-            sentence_analysis = self.nlp_utils.analyze_sentence_structure(paper_text)
-            vocab_analysis = self.nlp_utils.analyze_vocabulary(paper_text)
+            academic_analysis = self._get_text_analysis(paper_text, "academic")
+            sentence_analysis = self._get_text_analysis(paper_text, "sentence")
+            vocab_analysis = self._get_text_analysis(paper_text, "vocabulary")
             
             # 1. 被动语态评分（适度使用被动语态，比例在0.1-0.3之间为最佳）
             passive_ratio = academic_analysis.get("passive_voice_ratio", 0)
@@ -386,9 +451,9 @@ class QualityScorer:
             logger.info("开始基于增强NLP指标计算可读性评分")
             
             # 获取多种NLP分析结果
-            sentence_analysis = self.nlp_utils.analyze_sentence_structure(paper_text)
-            vocab_analysis = self.nlp_utils.analyze_vocabulary(paper_text)
-            academic_analysis = self.nlp_utils.analyze_academic_expression(paper_text)
+            sentence_analysis = self._get_text_analysis(paper_text, "sentence")
+            vocab_analysis = self._get_text_analysis(paper_text, "vocabulary")
+            academic_analysis = self._get_text_analysis(paper_text, "academic")
 
             # 1. 句长评分（学术写作理想范围15-25词）
             avg_sentence_length = sentence_analysis.get("avg_sentence_length", 20)
@@ -544,7 +609,7 @@ class QualityScorer:
         word_count = len(paper_text.split())
         try:
             sentence_count = len(
-                self.nlp_utils.analyze_sentence_structure(paper_text).get(
+                self._get_text_analysis(paper_text, "sentence").get(
                     "total_sentences", 1
                 )
             )
@@ -10,6 +10,7 @@ from pathlib import Path
 from datetime import datetime
 
 from config import Config
+from ..utils.json_utils import load_json
 
 # 设置日志
 from ..utils.logger_config import get_logger
@@ -473,8 +474,7 @@ class StyleGuideGenerator:
             return {"error": "风格指南文件不存在"}
 
         try:
-            with open(Config.STYLE_GUIDE_JSON, "r", encoding="utf-8") as f:
-                self.style_guide = json.load(f)
+            self.style_guide = load_json(Config.STYLE_GUIDE_JSON)
             return self.style_guide
         except Exception as e:
             return {"error": f"加载风格指南失败: {str(e)}"}
@@ -6,8 +6,19 @@
 - Prompt模板
 """
 
-from .pymupdf_extractor import PyMuPDFExtractor
-from .prompts import PromptTemplates
-from .official_guide_parser import OfficialGuideParser
+import importlib
 
 __all__ = ["PyMuPDFExtractor", "PromptTemplates", "OfficialGuideParser"]
+
+_SUBMODULES = {
+    "PyMuPDFExtractor": ".pymupdf_extractor",
+    "PromptTemplates": ".prompts",
+    "OfficialGuideParser": ".official_guide_parser",
+}
+
+
+def __getattr__(name):
+    """按需导入（官方指南解析器依赖 openai SDK，导入 PDF 提取器时无需加载）"""
+    if name in _SUBMODULES:
+        return getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,17 +2,24 @@
 PyMuPDF PDF文本提取器
 
 基于PyMuPDF的简化PDF文本提取器，提供更好的双栏布局处理。
+PyMuPDF（MuPDF的C实现）的文本提取速度比纯Python的pypdf/pdfminer快5~30倍，
+是 extract/status 命令唯一的解析后端，请勿替换为纯Python实现。
 """
 
-import fitz
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..utils.logger_config import get_logger
 
 logger = get_logger(__name__)
 
+# 并行提取的默认最大进程数（超过4~6个进程后MuPDF解析的加速基本饱和）
+MAX_EXTRACT_WORKERS = 6
+
 
 class PyMuPDFExtractor:
     """PyMuPDF PDF文本提取器"""
@@ -37,70 +44,110 @@ class PyMuPDFExtractor:
             提取结果统计
         """
         pdf_files = list(self.input_dir.glob("*.pdf"))
-
         if not pdf_files:
-            logger.warning(f"在 {self.input_dir} 中没有找到PDF文件")
-            return {
-                "success": False,
-                "message": "没有找到PDF文件",
-                "total_files": 0,
-                "successful_extractions": 0,
-                "failed_extractions": 0,
-            }
+            return self._no_pdf_result()
 
         logger.info(f"找到 {len(pdf_files)} 个PDF文件")
+        results = self._new_results(len(pdf_files))
+
+        for pdf_file in pdf_files:
+            logger.info(f"正在提取: {pdf_file.name}")
+            _, result = _extract_one(self, pdf_file)
+            self._record_result(results, pdf_file.name, result)
+
+        logger.info(
+            f"提取完成: 成功 {results['successful_extractions']}, 失败 {results['failed_extractions']}"
+        )
+        return results
+
+    def extract_all_pdfs_parallel(self, num_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        使用多进程并行提取所有PDF文件的文本
+
+        每个PDF在独立进程中解析（MuPDF解码为CPU密集型，线程受GIL限制），
+        结果按文件顺序汇总，格式与 extract_all_pdfs 相同。
+
+        Args:
+            num_workers: 并行进程数，默认为 min(CPU核数, 6)
+
+        Returns:
+            提取结果统计
+        """
+        pdf_files = list(self.input_dir.glob("*.pdf"))
+        if not pdf_files:
+            return self._no_pdf_result()
+
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+        num_workers = min(num_workers, len(pdf_files))
+        if num_workers <= 1:
+            return self.extract_all_pdfs()
+
+        logger.info(f"找到 {len(pdf_files)} 个PDF文件，使用 {num_workers} 个进程并行提取")
+        results = self._new_results(len(pdf_files))
+
+        # 进程间传递的是可pickle的提取器副本和路径；每个进程分到几个文件，摊薄通信开销
+        chunksize = max(2, len(pdf_files) // (num_workers * 4))
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            for pdf_name, result in executor.map(
+                _extract_one, repeat(self), pdf_files, chunksize=chunksize
+            ):
+                self._record_result(results, pdf_name, result)
 
-        results = {
+        logger.info(
+            f"提取完成: 成功 {results['successful_extractions']}, 失败 {results['failed_extractions']}"
+        )
+        return results
+
+    def _no_pdf_result(self) -> Dict[str, Any]:
+        """输入目录中没有PDF文件时的结果"""
+        logger.warning(f"在 {self.input_dir} 中没有找到PDF文件")
+        return {
+            "success": False,
+            "message": "没有找到PDF文件",
+            "total_files": 0,
+            "successful_extractions": 0,
+            "failed_extractions": 0,
+        }
+
+    @staticmethod
+    def _new_results(total_files: int) -> Dict[str, Any]:
+        """创建空的提取结果统计"""
+        return {
             "success": True,
-            "total_files": len(pdf_files),
+            "total_files": total_files,
             "successful_extractions": 0,
             "failed_extractions": 0,
             "total_characters": 0,
+            "two_column_count": 0,
             "extraction_details": [],
         }
 
-        for pdf_file in pdf_files:
-            try:
-                logger.info(f"正在提取: {pdf_file.name}")
-                result = self.extract_single_pdf(pdf_file)
-
-                if result["success"]:
-                    results["successful_extractions"] += 1
-                    results["total_characters"] += result.get("character_count", 0)
-                    logger.info(
-                        f"成功提取: {pdf_file.name} ({result.get('character_count', 0)} 字符)"
-                    )
-                else:
-                    results["failed_extractions"] += 1
-                    logger.error(
-                        f"提取失败: {pdf_file.name} - {result.get('error', '未知错误')}"
-                    )
-
-                results["extraction_details"].append(
-                    {
-                        "filename": pdf_file.name,
-                        "success": result["success"],
-                        "character_count": result.get("character_count", 0),
-                        "error": result.get("error", None),
-                    }
-                )
-
-            except Exception as e:
-                results["failed_extractions"] += 1
-                logger.error(f"提取 {pdf_file.name} 时出现异常: {str(e)}")
-                results["extraction_details"].append(
-                    {
-                        "filename": pdf_file.name,
-                        "success": False,
-                        "character_count": 0,
-                        "error": str(e),
-                    }
-                )
+    @staticmethod
+    def _record_result(results: Dict[str, Any], pdf_name: str, result: Dict[str, Any]):
+        """将单个PDF的提取结果计入统计"""
+        if result["success"]:
+            results["successful_extractions"] += 1
+            results["total_characters"] += result.get("character_count", 0)
+            if result.get("is_two_column", False):
+                results["two_column_count"] += 1
+            logger.info(
+                f"成功提取: {pdf_name} ({result.get('character_count', 0)} 字符)"
+            )
+        else:
+            results["failed_extractions"] += 1
+            logger.error(
+                f"提取失败: {pdf_name} - {result.get('error', '未知错误')}"
+            )
 
-        logger.info(
-            f"提取完成: 成功 {results['successful_extractions']}, 失败 {results['failed_extractions']}"
+        results["extraction_details"].append(
+            {
+                "filename": pdf_name,
+                "success": result["success"],
+                "character_count": result.get("character_count", 0),
+                "error": result.get("error", None),
+            }
         )
-        return results
 
     def extract_single_pdf(self, pdf_path: Path) -> Dict[str, Any]:
         """
@@ -112,6 +159,9 @@ class PyMuPDFExtractor:
         Returns:
             提取结果
         """
+        # 按需导入PyMuPDF（C扩展加载较慢，只读取提取结果摘要时不需要）
+        import fitz
+
         try:
             # 打开PDF文件
             doc = fitz.open(str(pdf_path))
@@ -378,3 +428,24 @@ class PyMuPDFExtractor:
             "total_characters": total_characters,
             "output_directory": str(self.output_dir),
         }
+
+
+def _extract_one(extractor: PyMuPDFExtractor, pdf_path: Path) -> Tuple[str, Dict[str, Any]]:
+    """
+    提取单个PDF（模块级函数，可被进程池pickle调用）
+
+    逐页的 layout_info 只在汇总时用到是否双栏，这里换成布尔值 is_two_column，
+    避免经进程间通信回传每个文件完整的页面布局信息。
+
+    Returns:
+        (文件名, 提取结果)
+    """
+    try:
+        result = extractor.extract_single_pdf(pdf_path)
+        layout_info = result.pop("layout_info", None)
+        if result["success"]:
+            result["is_two_column"] = bool(layout_info and layout_info.get("is_two_column", False))
+        return pdf_path.name, result
+    except Exception as e:
+        logger.error(f"提取 {pdf_path.name} 时出现异常: {str(e)}")
+        return pdf_path.name, {"success": False, "error": str(e)}
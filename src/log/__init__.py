@@ -12,6 +12,7 @@ from .utils import (
     get_log_summary,
     get_recent_errors,
     get_recent_warnings,
+    scan_log,
     search_logs_by_keyword,
     get_log_files_info
 )
@@ -27,6 +28,7 @@ __all__ = [
     'get_log_summary',
     'get_recent_errors',
     'get_recent_warnings',
+    'scan_log',
     'search_logs_by_keyword',
     'get_log_files_info'
 ]
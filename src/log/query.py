@@ -6,9 +6,10 @@
 import os
 import re
 import json
+import heapq
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass
 from collections import defaultdict, Counter
 
@@ -122,18 +123,26 @@ class LogQuery:
         Returns:
             日志条目列表
         """
-        entries = []
+        return list(self.iter_log_file(file_path))
+    
+    def iter_log_file(self, file_path: Path) -> Iterator[LogEntry]:
+        """
+        逐行读取日志文件，按需产出解析后的日志条目（不在内存中保留整个文件）
         
+        Args:
+            file_path: 日志文件路径
+            
+        Yields:
+            日志条目
+        """
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 for line_number, line in enumerate(f, 1):
                     entry = self.parse_log_line(line, line_number)
                     if entry:
-                        entries.append(entry)
+                        yield entry
         except Exception as e:
             logger.error(f"读取日志文件失败 {file_path}: {str(e)}")
-        
-        return entries
     
     def query_logs(
         self,
@@ -256,6 +265,64 @@ class LogQuery:
             warning_count=warning_count
         )
     
+    def scan_logs(self, recent_limit: int = 10) -> Tuple[LogStats, List[LogEntry], List[LogEntry]]:
+        """
+        单次遍历所有日志文件，同时得到统计信息和最近的错误、警告日志
+        
+        Args:
+            recent_limit: 最近错误/警告日志的返回数量
+            
+        Returns:
+            (日志统计信息, 最近错误日志列表, 最近警告日志列表)，
+            错误/警告的顺序与 search_errors/search_warnings 一致
+        """
+        level_counts = Counter()
+        logger_counts = Counter()
+        recent = {'ERROR': [], 'WARNING': []}
+        start_time = end_time = None
+        total_entries = 0
+        file_size = 0
+        
+        for log_file in self.get_log_files():
+            file_size += log_file.stat().st_size
+            for entry in self.iter_log_file(log_file):
+                total_entries += 1
+                level_counts[entry.level] += 1
+                logger_counts[entry.logger_name] += 1
+                
+                if start_time is None or entry.timestamp < start_time:
+                    start_time = entry.timestamp
+                if end_time is None or entry.timestamp > end_time:
+                    end_time = entry.timestamp
+                
+                # 只保留时间最新的 recent_limit 条（同一时间先读到的优先）
+                heap = recent.get(entry.level)
+                if heap is not None and recent_limit > 0:
+                    item = (entry.timestamp, -total_entries, entry)
+                    if len(heap) < recent_limit:
+                        heapq.heappush(heap, item)
+                    else:
+                        heapq.heappushpop(heap, item)
+        
+        if not total_entries:
+            now = datetime.now()
+            start_time = end_time = now
+        
+        stats = LogStats(
+            total_entries=total_entries,
+            level_counts=dict(level_counts),
+            logger_counts=dict(logger_counts),
+            time_range=(start_time, end_time),
+            file_size=file_size,
+            error_count=level_counts.get('ERROR', 0),
+            warning_count=level_counts.get('WARNING', 0)
+        )
+        errors, warnings = (
+            [item[2] for item in sorted(recent[level], reverse=True)]
+            for level in ('ERROR', 'WARNING')
+        )
+        return stats, errors, warnings
+    
     def search_errors(self, limit: int = 50) -> List[LogEntry]:
         """
         搜索错误日志
@@ -3,6 +3,8 @@
 提供便捷的日志查询和管理功能
 """
 
+from collections import Counter
+
 from .query import LogQuery, LogEntry, LogStats
 from ..utils.logger_config import get_logger
 
@@ -32,11 +34,19 @@ def quick_search_keyword(keyword: str, limit: int = 20) -> list[LogEntry]:
     return query.search_by_keyword(keyword, limit=limit)
 
 
-def get_log_summary() -> dict:
-    """获取日志摘要信息"""
-    query = get_log_query()
-    stats = query.get_log_stats()
-    
+def _entry_to_dict(entry: LogEntry) -> dict:
+    """日志条目转为字典"""
+    return {
+        "timestamp": entry.timestamp.isoformat(),
+        "level": entry.level,
+        "logger_name": entry.logger_name,
+        "message": entry.message,
+        "line_number": entry.line_number
+    }
+
+
+def _stats_to_summary(stats: LogStats) -> dict:
+    """统计信息转为日志摘要字典"""
     return {
         "total_entries": stats.total_entries,
         "error_count": stats.error_count,
@@ -47,53 +57,50 @@ def get_log_summary() -> dict:
             "end": stats.time_range[1].isoformat() if stats.time_range[1] else None
         },
         "level_distribution": stats.level_counts,
-        "logger_distribution": dict(list(stats.logger_counts.items())[:10])  # 前10个日志器
+        "logger_distribution": dict(Counter(stats.logger_counts).most_common(10)),  # 条目最多的前10个日志器
+        "logger_total": len(stats.logger_counts)
     }
 
 
+def get_log_summary() -> dict:
+    """获取日志摘要信息"""
+    query = get_log_query()
+    return _stats_to_summary(query.get_log_stats())
+
+
 def get_recent_errors(limit: int = 10) -> list[dict]:
     """获取最近的错误日志"""
     errors = quick_search_errors(limit)
-    return [
-        {
-            "timestamp": entry.timestamp.isoformat(),
-            "level": entry.level,
-            "logger_name": entry.logger_name,
-            "message": entry.message,
-            "line_number": entry.line_number
-        }
-        for entry in errors
-    ]
+    return [_entry_to_dict(entry) for entry in errors]
 
 
 def get_recent_warnings(limit: int = 10) -> list[dict]:
     """获取最近的警告日志"""
     warnings = quick_search_warnings(limit)
-    return [
-        {
-            "timestamp": entry.timestamp.isoformat(),
-            "level": entry.level,
-            "logger_name": entry.logger_name,
-            "message": entry.message,
-            "line_number": entry.line_number
-        }
-        for entry in warnings
-    ]
+    return [_entry_to_dict(entry) for entry in warnings]
+
+
+def scan_log(recent_limit: int = 10) -> dict:
+    """
+    单次遍历日志文件，同时获取日志摘要和最近的错误、警告日志
+    
+    结果与分别调用 get_log_summary、get_recent_errors、get_recent_warnings 相同，
+    但日志文件只读取一遍
+    """
+    query = get_log_query()
+    stats, errors, warnings = query.scan_logs(recent_limit)
+    
+    return {
+        "summary": _stats_to_summary(stats),
+        "errors": [_entry_to_dict(entry) for entry in errors],
+        "warnings": [_entry_to_dict(entry) for entry in warnings]
+    }
 
 
 def search_logs_by_keyword(keyword: str, limit: int = 20) -> list[dict]:
     """按关键词搜索日志"""
     entries = quick_search_keyword(keyword, limit)
-    return [
-        {
-            "timestamp": entry.timestamp.isoformat(),
-            "level": entry.level,
-            "logger_name": entry.logger_name,
-            "message": entry.message,
-            "line_number": entry.line_number
-        }
-        for entry in entries
-    ]
+    return [_entry_to_dict(entry) for entry in entries]
 
 
 def get_log_files_info() -> list[dict]:
@@ -109,7 +116,7 @@ def get_log_files_info() -> list[dict]:
                 "name": file_path.name,
                 "size_kb": round(stat.st_size / 1024, 2),
                 "modified_time": stat.st_mtime,
-                "modified_datetime": file_path.stat().st_mtime
+                "modified_datetime": stat.st_mtime
             })
         except Exception as e:
             logger.warning(f"获取文件信息失败 {file_path}: {str(e)}")
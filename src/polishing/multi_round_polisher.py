@@ -6,7 +6,8 @@
 
 import json
 import re
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -14,6 +15,7 @@ from ..analysis.quality_scorer import QualityScorer
 from ..core.prompts import PromptTemplates
 from ..core.ai_client import get_ai_client, AICallError
 from config import Config
+from ..utils.json_utils import load_json
 
 # 设置日志
 from ..utils.logger_config import get_logger
@@ -21,20 +23,39 @@ from ..utils.style_dimensions import normalize_dimension_label
 
 logger = get_logger(__name__)
 
+# 段落分隔（空行），捕获分组用于保留原分隔符
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"(\n\s*\n)")
+
 
 class MultiRoundPolisher:
     """多轮润色器"""
 
-    def __init__(self):
-        """初始化润色器"""
+    def __init__(
+        self,
+        style_guide: Optional[Dict] = None,
+        quality_scorer: Optional[QualityScorer] = None,
+    ):
+        """
+        初始化润色器
+
+        润色状态（current_text、modification_history 等）保存在实例上，每次润色应使用独立实例；
+        加载开销大的只读资源可由调用方传入，在多个实例间共享。
+
+        Args:
+            style_guide: 已加载的风格指南（只读），默认从混合风格指南文件加载
+            quality_scorer: 共享的质量评分器，默认新建
+        """
         self.ai_client = get_ai_client()
         self.prompts = PromptTemplates()
-        self.quality_scorer = QualityScorer()
+        self.quality_scorer = quality_scorer or QualityScorer()
         self.ai_config = Config.get_ai_config()
 
         # 加载规则库
         self.style_guide = {}
-        self._load_style_guide()
+        if style_guide is not None:
+            self.style_guide = style_guide
+        else:
+            self._load_style_guide()
 
         # 润色状态
         self.current_text = ""
@@ -48,8 +69,7 @@ class MultiRoundPolisher:
         hybrid_guide_path = "data/hybrid_style_guide.json"
         if Path(hybrid_guide_path).exists():
             try:
-                with open(hybrid_guide_path, "r", encoding="utf-8") as f:
-                    self.style_guide = json.load(f)
+                self.style_guide = load_json(hybrid_guide_path)
                 logger.info("成功加载混合风格指南")
                 return
             except Exception as e:
@@ -70,69 +90,58 @@ class MultiRoundPolisher:
         Returns:
             润色结果
         """
-        logger.info(f"开始{'交互式' if interactive else '非交互式'}润色论文（基于规则库）")
-
-        try:
-            # 初始化
-            self.current_text = paper_text
-            self.modification_history = []
-            self.user_selections = {}
-
-            # 计算润色前评分
-            before_scores = self.quality_scorer.score_paper(paper_text)
+        return self._final_result(self.polish_paper_iter(paper_text, interactive=interactive))
 
-            # 执行润色
-            if interactive:
-                self._interactive_polishing()
-            else:
-                self._batch_polishing()
+    def polish_paper_simple(self, paper_text: str) -> Dict:
+        """
+        简洁润色论文（只返回润色后的文本，不包含详细修改说明）
 
-            # 计算润色后评分
-            after_scores = self.quality_scorer.score_paper(self.current_text)
+        Args:
+            paper_text: 原始论文文本
 
-            # 比较评分
-            score_comparison = self.quality_scorer.compare_scores(
-                before_scores, after_scores
-            )
+        Returns:
+            简洁润色结果
+        """
+        return self._final_result(self.polish_paper_iter(paper_text, simple=True))
 
-            # 生成最终结果（不包含风格字段）
-            final_result = {
-                "success": True,
-                "original_text": paper_text,
-                "polished_text": self.current_text,
-                "modification_history": self.modification_history,
-                "before_scores": before_scores,
-                "after_scores": after_scores,
-                "score_comparison": score_comparison,
-                "user_selections": self.user_selections,
-                "polishing_summary": self._generate_polishing_summary(),
-                "timestamp": datetime.now().isoformat(),
-                "interactive_mode": interactive,
-            }
+    def polish_paper_parallel(self, paper_text: str) -> Dict:
+        """
+        按段落并行简洁润色论文（适合长文；每段单独调用AI，token消耗更多）
 
-            logger.info("论文润色完成")
-            return final_result
+        Args:
+            paper_text: 原始论文文本
 
-        except Exception as e:
-            logger.error(f"论文润色失败: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "original_text": paper_text,
-                "polished_text": paper_text,
-            }
+        Returns:
+            简洁润色结果
+        """
+        return self._final_result(
+            self.polish_paper_iter(paper_text, simple=True, parallel=True)
+        )
 
-    def polish_paper_simple(self, paper_text: str) -> Dict:
+    def polish_paper_iter(
+        self,
+        paper_text: str,
+        simple: bool = False,
+        interactive: bool = False,
+        parallel: bool = False,
+    ) -> Iterator[Dict]:
         """
-        简洁润色论文（只返回润色后的文本，不包含详细修改说明）
+        逐阶段润色论文，每个阶段开始前产出一个进度事件，供界面实时展示进度
 
         Args:
             paper_text: 原始论文文本
+            simple: 是否使用简洁润色（只返回润色后的文本）
+            interactive: 是否使用交互式润色（仅完整模式有效）
+            parallel: 是否按段落并行润色（仅简洁模式有效）
 
-        Returns:
-            简洁润色结果
+        Yields:
+            进度事件 {"stage": 阶段标识, "label": 阶段说明}；
+            最后一个事件的 stage 为 "done"，其 "result" 与 polish_paper/polish_paper_simple 的返回值相同
         """
-        logger.info("开始简洁润色论文（基于规则库）")
+        if simple:
+            logger.info("开始简洁润色论文（基于规则库）")
+        else:
+            logger.info(f"开始{'交互式' if interactive else '非交互式'}润色论文（基于规则库）")
 
         try:
             # 初始化
@@ -141,47 +150,80 @@ class MultiRoundPolisher:
             self.user_selections = {}
 
             # 计算润色前评分
+            yield {"stage": "score_before", "label": "正在计算润色前评分..."}
             before_scores = self.quality_scorer.score_paper(paper_text)
 
-            # 执行简洁润色（规则库）
-            polished_text = self._simple_polish()
+            # 执行润色
+            yield {"stage": "polish", "label": "正在根据风格指南润色..."}
+            if simple:
+                self.current_text = (
+                    self._parallel_simple_polish() if parallel else self._simple_polish()
+                )
+            elif interactive:
+                self._interactive_polishing()
+            else:
+                self._batch_polishing()
 
             # 计算润色后评分
-            after_scores = self.quality_scorer.score_paper(polished_text)
+            yield {"stage": "score_after", "label": "正在计算润色后评分..."}
+            after_scores = self.quality_scorer.score_paper(self.current_text)
 
             # 比较评分
             score_comparison = self.quality_scorer.compare_scores(
                 before_scores, after_scores
             )
 
-            # 生成简洁结果（不包含风格字段）
-            final_result = {
-                "success": True,
-                "original_text": paper_text,
-                "polished_text": polished_text,
-                "before_scores": before_scores,
-                "after_scores": after_scores,
-                "score_comparison": score_comparison,
-                "polishing_summary": {
-                    "total_rounds": 1,
-                    "total_modifications_applied": 1,
-                },
-                "timestamp": datetime.now().isoformat(),
-                "simple_mode": True,
-            }
-
-            logger.info("简洁润色完成")
-            return final_result
+            # 生成最终结果（不包含风格字段）
+            if simple:
+                final_result = {
+                    "success": True,
+                    "original_text": paper_text,
+                    "polished_text": self.current_text,
+                    "before_scores": before_scores,
+                    "after_scores": after_scores,
+                    "score_comparison": score_comparison,
+                    "polishing_summary": {
+                        "total_rounds": 1,
+                        "total_modifications_applied": 1,
+                    },
+                    "timestamp": datetime.now().isoformat(),
+                    "simple_mode": True,
+                }
+                logger.info("简洁润色完成")
+            else:
+                final_result = {
+                    "success": True,
+                    "original_text": paper_text,
+                    "polished_text": self.current_text,
+                    "modification_history": self.modification_history,
+                    "before_scores": before_scores,
+                    "after_scores": after_scores,
+                    "score_comparison": score_comparison,
+                    "user_selections": self.user_selections,
+                    "polishing_summary": self._generate_polishing_summary(),
+                    "timestamp": datetime.now().isoformat(),
+                    "interactive_mode": interactive,
+                }
+                logger.info("论文润色完成")
 
         except Exception as e:
-            logger.error(f"简洁润色失败: {str(e)}")
-            return {
+            logger.error(f"{'简洁润色' if simple else '论文润色'}失败: {str(e)}")
+            final_result = {
                 "success": False,
                 "error": str(e),
                 "original_text": paper_text,
                 "polished_text": paper_text,
             }
 
+        yield {"stage": "done", "label": "润色完成", "result": final_result}
+
+    @staticmethod
+    def _final_result(events: Iterator[Dict]) -> Dict:
+        """消费进度事件，返回最终润色结果"""
+        for event in events:
+            if event["stage"] == "done":
+                return event["result"]
+
     def polish_paper_with_choices(
         self,
         paper_text: str,
@@ -719,18 +761,31 @@ class MultiRoundPolisher:
         
         return '\n'.join(fixed_lines)
 
-    def _simple_polish(self) -> str:
+    def _style_rules_json(self) -> str:
+        """将规则库序列化为prompt中使用的JSON（缩进2格）"""
+        return json.dumps(self.style_guide, ensure_ascii=False, indent=2)
+
+    def _simple_polish(
+        self, text: Optional[str] = None, style_rules: Optional[str] = None
+    ) -> str:
         """
         简洁润色处理（规则库，无风格字段，仅返回润色后的文本）
 
+        Args:
+            text: 待润色文本，默认为当前文本
+            style_rules: 已序列化的规则库JSON，默认现场序列化（按段落并行时由调用方序列化一次后复用）
+
         Returns:
             润色后的文本
         """
+        if text is None:
+            text = self.current_text
+
         try:
             # 使用已加载的规则库
             if not self.style_guide:
                 logger.warning("规则库未加载，返回原文")
-                return self.current_text
+                return text
 
             rules_count = self.style_guide.get('total_rules') or len(self.style_guide.get('rules', []))
             logger.info(f"使用规则库进行简洁润色，规则数量: {rules_count}")
@@ -741,8 +796,8 @@ class MultiRoundPolisher:
             # 格式化prompt，传入规则库（不含风格选择）
             prompt = self.prompts.format_prompt(
                 prompt_template,
-                style_rules=json.dumps(self.style_guide, ensure_ascii=False, indent=2),
-                paper_text=self.current_text
+                style_rules=style_rules or self._style_rules_json(),
+                paper_text=text
             )
 
             # 调用AI
@@ -757,13 +812,45 @@ class MultiRoundPolisher:
                 ).strip()
             except AICallError as e:
                 logger.error(f"AI调用失败: {str(e)}")
-                return self.current_text
+                return text
 
             return polished_text
 
         except Exception as e:
             logger.error(f"简洁润色处理失败: {str(e)}")
-            return self.current_text
+            return text
+
+    def _parallel_simple_polish(self, max_workers: Optional[int] = None) -> str:
+        """
+        按段落并行简洁润色（段落间无依赖，AI调用以网络等待为主，使用线程池并发）
+
+        Args:
+            max_workers: 最大并发数，默认使用配置中的 POLISH_MAX_WORKERS
+
+        Returns:
+            按原顺序拼接的润色后文本（段落分隔符保持不变）
+        """
+        # 保留分隔符，便于按原样拼接
+        parts = PARAGRAPH_SPLIT_PATTERN.split(self.current_text)
+        paragraph_indices = [i for i in range(0, len(parts), 2) if parts[i].strip()]
+
+        if len(paragraph_indices) <= 1:
+            return self._simple_polish()
+
+        workers = min(max_workers or Config.POLISH_MAX_WORKERS, len(paragraph_indices))
+        logger.info(f"按段落并行润色: {len(paragraph_indices)}段, 并发数: {workers}")
+
+        # 规则库只序列化一次，各段落的prompt共用
+        style_rules = self._style_rules_json()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            polished = executor.map(
+                lambda paragraph: self._simple_polish(paragraph, style_rules),
+                (parts[i] for i in paragraph_indices),
+            )
+            for i, polished_paragraph in zip(paragraph_indices, polished):
+                parts[i] = polished_paragraph
+
+        return "".join(parts)
 
     def _generate_polishing_summary(self) -> Dict:
         """
@@ -3,8 +3,35 @@
 
 包含基础工具和辅助功能：
 - NLP文本分析
+- JSON文件读写
 """
 
-from .nlp_utils import NLPUtils
+from .json_utils import (
+    count_json_items,
+    dump_json,
+    dumps_json,
+    load_guide_preview,
+    load_json,
+    load_json_fields,
+    loads_json,
+)
 
-__all__ = ["NLPUtils"]
+__all__ = [
+    "NLPUtils",
+    "count_json_items",
+    "dump_json",
+    "dumps_json",
+    "load_guide_preview",
+    "load_json",
+    "load_json_fields",
+    "loads_json",
+]
+
+
+def __getattr__(name):
+    """按需导入 NLPUtils（依赖 spaCy/scikit-learn，导入开销较大）"""
+    if name == "NLPUtils":
+        from .nlp_utils import NLPUtils
+
+        return NLPUtils
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
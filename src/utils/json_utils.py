@@ -0,0 +1,244 @@
+"""
+JSON读写工具
+
+统一的JSON文件读写入口：优先使用 orjson（C实现，解析和序列化更快），
+未安装时回退到标准库 json。orjson 不支持的内容（NaN/Infinity 等）同样交给标准库处理，
+结果与标准库一致。只需要大文件中少数字段时，可用 ijson 流式读取。
+"""
+
+import gzip
+import json
+import math
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ijson 解析事件中表示标量值的事件类型
+_SCALAR_EVENTS = ("string", "number", "boolean", "null")
+
+# ijson 解析事件中表示一个数组元素开始的事件类型
+_ITEM_START_EVENTS = ("start_map", "start_array") + _SCALAR_EVENTS
+
+# 风格指南预览所需的顶层标量字段
+_GUIDE_PREVIEW_FIELDS = ("style_guide_version", "generation_date", "total_papers_analyzed")
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    解析JSON内容
+
+    Args:
+        data: JSON字节或字符串
+
+    Returns:
+        解析后的对象
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson 不接受 NaN/Infinity 等标准库可以解析的写法
+            pass
+    return json.loads(data)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    读取并解析JSON文件（按字节读取，跳过文本模式的逐块解码；.gz 文件自动解压）
+
+    Args:
+        path: JSON文件路径
+
+    Returns:
+        解析后的对象
+    """
+    if str(path).endswith(".gz"):
+        with gzip.open(path, "rb") as f:
+            return loads_json(f.read())
+    return loads_json(Path(path).read_bytes())
+
+
+def load_json_fields(path: Union[str, Path], keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    读取JSON文件顶层对象中的若干标量字段
+
+    安装了 ijson 时流式解析，找齐字段后立即停止，不构建 rules 等大型嵌套结构；
+    否则回退为完整解析。
+
+    Args:
+        path: JSON文件路径
+        keys: 需要读取的顶层字段名
+
+    Returns:
+        {字段名: 值}，文件中不存在的字段不会出现在结果中
+    """
+    keys = set(keys)
+    if ijson is None:
+        data = load_json(path)
+        return {key: data[key] for key in keys if key in data}
+
+    fields = {}
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix in keys and event in _SCALAR_EVENTS:
+                fields[prefix] = value
+                if len(fields) == len(keys):
+                    break
+    return fields
+
+
+def count_json_items(path: Union[str, Path], key: str) -> int:
+    """
+    统计JSON文件顶层对象中某个数组字段的元素个数（安装了 ijson 时流式计数，不构建元素对象）
+
+    Args:
+        path: JSON文件路径
+        key: 顶层数组字段名
+
+    Returns:
+        元素个数，字段不存在时为0
+    """
+    if ijson is None:
+        return len(load_json(path).get(key, []))
+
+    item_prefix = f"{key}.item"
+    count = 0
+    with open(path, "rb") as f:
+        for prefix, event, _ in ijson.parse(f):
+            if prefix == item_prefix and event in _ITEM_START_EVENTS:
+                count += 1
+    return count
+
+
+def load_guide_preview(path: Union[str, Path], core_limit: int = 5) -> Dict[str, Any]:
+    """
+    读取风格指南的预览信息：顶层元数据、rule_summary、前若干条核心规则和各类别规则数
+
+    安装了 ijson 时单遍流式解析，只构建要展示的对象（rule_summary、前若干条核心规则和
+    categories），rules 中的其余规则不会被实例化；否则回退为完整解析。两种方式结果相同。
+
+    Args:
+        path: 风格指南JSON文件路径
+        core_limit: 返回的核心规则条数上限
+
+    Returns:
+        包含顶层元数据字段、rule_summary、core_rules、category_counts 的字典
+    """
+    if ijson is None:
+        guide = load_json(path)
+        preview = {key: guide[key] for key in _GUIDE_PREVIEW_FIELDS if key in guide}
+        preview["rule_summary"] = guide.get("rule_summary", {})
+        preview["core_rules"] = list(islice(
+            (rule for rule in guide.get("rules", []) if rule.get("rule_type") == "core"), core_limit
+        ))
+        preview["category_counts"] = {
+            category: len(rules) for category, rules in guide.get("categories", {}).items()
+        }
+        return preview
+
+    preview = {"rule_summary": {}, "core_rules": [], "category_counts": {}}
+    core_rules = preview["core_rules"]
+    # 正在构建的对象：[对象前缀, ObjectBuilder, 嵌套深度]；深度回到0时对象构建完成
+    building = None
+
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if building is None:
+                if prefix in _GUIDE_PREVIEW_FIELDS and event in _SCALAR_EVENTS:
+                    preview[prefix] = value
+                    continue
+                if event != "start_map" or not (
+                    prefix in ("rule_summary", "categories")
+                    or (prefix == "rules.item" and len(core_rules) < core_limit)
+                ):
+                    continue
+                building = [prefix, ijson.ObjectBuilder(), 0]
+
+            builder_prefix, builder, depth = building
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            building[2] = depth
+            if depth:
+                continue
+
+            # 对象构建完成
+            building = None
+            if builder_prefix == "rule_summary":
+                preview["rule_summary"] = builder.value
+            elif builder_prefix == "categories":
+                # 类别名可能含"."，不能依赖 ijson 前缀匹配；各类别的值按完整解析相同的方式取 len()
+                preview["category_counts"] = {
+                    category: len(rules) for category, rules in builder.value.items()
+                }
+            elif builder.value.get("rule_type") == "core":
+                core_rules.append(builder.value)
+    return preview
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """递归检查对象中是否含有 NaN/Infinity 浮点数"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in data)
+    return False
+
+
+def dumps_json(data: Any, pretty: bool = True) -> bytes:
+    """
+    将对象序列化为UTF-8编码的JSON字节（保留非ASCII字符）
+
+    Args:
+        data: 要序列化的对象
+        pretty: 是否缩进2格；为False时输出无多余空白的紧凑格式
+
+    Returns:
+        JSON字节
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            content = orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            # orjson 不支持的类型（如超过64位的整数），交给标准库处理
+            pass
+        else:
+            # orjson 会把 NaN/Infinity 静默写成 null；输出含 null 时才检查原数据，
+            # 含非有限浮点数时改用标准库，保留原值
+            if b"null" not in content or not _has_non_finite_float(data):
+                return content
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dump_json(data: Any, path: Union[str, Path], pretty: bool = True) -> None:
+    """
+    将对象写入JSON文件（默认缩进2格；路径以 .gz 结尾时gzip压缩写入）
+
+    Args:
+        data: 要保存的对象
+        path: JSON文件路径
+        pretty: 是否缩进2格
+    """
+    content = dumps_json(data, pretty)
+    if str(path).endswith(".gz"):
+        with gzip.open(path, "wb") as f:
+            f.write(content)
+    else:
+        Path(path).write_bytes(content)
@@ -0,0 +1,51 @@
+"""
+批次汇总文件排序测试
+
+generate_guide 按批次编号数值排序批次文件，无编号的文件按文件名排在最后。
+"""
+
+import unittest
+from pathlib import Path
+
+from main import _batch_sort_key
+
+
+def sort_names(names):
+    """按批次排序键排序文件名"""
+    return [path.name for path in sorted((Path("data/batch_summaries") / name for name in names), key=_batch_sort_key)]
+
+
+class TestBatchSortKey(unittest.TestCase):
+    """_batch_sort_key"""
+
+    def test_numeric_order(self):
+        self.assertEqual(
+            sort_names(["batch_10.json", "batch_2.json", "batch_1.json"]),
+            ["batch_1.json", "batch_2.json", "batch_10.json"],
+        )
+
+    def test_beyond_zero_padding(self):
+        # 批次编号按两位补零生成，超过99后不能按字符串排序
+        self.assertEqual(
+            sort_names(["batch_100.json", "batch_11.json", "batch_09.json", "batch_99.json", "batch_101.json"]),
+            ["batch_09.json", "batch_11.json", "batch_99.json", "batch_100.json", "batch_101.json"],
+        )
+
+    def test_same_number_different_padding(self):
+        self.assertEqual(sort_names(["batch_2.json", "batch_02.json"]), ["batch_02.json", "batch_2.json"])
+
+    def test_names_without_number_last(self):
+        self.assertEqual(
+            sort_names(["batch_summary.json", "batch_3.json", "batch_.json", "batch_12.json", "batch_final.json"]),
+            ["batch_3.json", "batch_12.json", "batch_.json", "batch_final.json", "batch_summary.json"],
+        )
+
+    def test_number_with_suffix(self):
+        self.assertEqual(
+            sort_names(["batch_10_retry.json", "batch_9.json", "batch_10.json"]),
+            ["batch_9.json", "batch_10.json", "batch_10_retry.json"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
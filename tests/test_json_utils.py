@@ -0,0 +1,275 @@
+"""
+JSON读写工具测试
+
+覆盖 gzip 读写、orjson/标准库回退、ijson 流式读取与完整解析回退的一致性，
+以及字段缺失、文件缺失等边界情况。
+"""
+
+import gzip
+import json
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.utils import json_utils
+from src.utils.json_utils import (
+    count_json_items,
+    dump_json,
+    dumps_json,
+    load_guide_preview,
+    load_json,
+    load_json_fields,
+    loads_json,
+)
+
+SAMPLE_DATA = {
+    "title": "风格指南",
+    "total_rules": 3,
+    "ratio": 0.75,
+    "enabled": True,
+    "note": None,
+    "batches": [{"batch_id": "batch_01"}, {"batch_id": "batch_02"}, [1, 2], "x"],
+    "empty": [],
+}
+
+SAMPLE_GUIDE = {
+    "style_guide_version": "3.0",
+    "generation_date": "2025-01-01",
+    "rules": [
+        {"rule_type": "core", "description": "规则1", "frequency": 0.9, "examples": [["a"], {"b": 1}]},
+        {"rule_type": "optional", "description": "规则2", "frequency": 0.4},
+        {"rule_type": "core", "description": "规则3", "frequency": 0.8},
+        {"rule_type": "core", "description": "规则4", "frequency": 0.7},
+    ],
+    "rule_summary": {"total_rules": 4, "core_rules": 3, "optional_rules": 1, "nested": {"a": [1, 2]}},
+    "categories": {"sentence.structure": [{"id": 1}, {"id": 2}], "vocabulary": [], "transitions": [{"id": 3}]},
+    "total_papers_analyzed": 12,
+}
+
+WITHOUT_IJSON = mock.patch.object(json_utils, "ijson", None)
+WITHOUT_ORJSON = mock.patch.object(json_utils, "orjson", None)
+REQUIRES_IJSON = unittest.skipIf(json_utils.ijson is None, "未安装 ijson")
+
+
+class JsonUtilsTestCase(unittest.TestCase):
+    """提供临时目录和写入样例文件的辅助方法"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_json(self, name, data):
+        path = self.tmp_dir / name
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return path
+
+
+class TestLoadDump(JsonUtilsTestCase):
+    """load_json / dump_json / dumps_json"""
+
+    def test_round_trip(self):
+        path = self.tmp_dir / "data.json"
+        dump_json(SAMPLE_DATA, path)
+        self.assertEqual(load_json(path), SAMPLE_DATA)
+
+    def test_gzip_round_trip(self):
+        for pretty in (True, False):
+            with self.subTest(pretty=pretty):
+                path = self.tmp_dir / f"data_{pretty}.json.gz"
+                dump_json(SAMPLE_DATA, path, pretty=pretty)
+                # 写入的是 gzip 文件，解压后为合法JSON
+                with gzip.open(path, "rb") as f:
+                    self.assertEqual(json.loads(f.read()), SAMPLE_DATA)
+                self.assertEqual(load_json(path), SAMPLE_DATA)
+                self.assertEqual(load_json(str(path)), SAMPLE_DATA)
+
+    def test_stdlib_fallback_matches_orjson(self):
+        expected = {pretty: json.loads(dumps_json(SAMPLE_DATA, pretty)) for pretty in (True, False)}
+        with WITHOUT_ORJSON:
+            for pretty in (True, False):
+                with self.subTest(pretty=pretty):
+                    content = dumps_json(SAMPLE_DATA, pretty)
+                    self.assertEqual(json.loads(content), expected[pretty])
+                    self.assertEqual(loads_json(content), SAMPLE_DATA)
+
+            path = self.tmp_dir / "fallback.json.gz"
+            dump_json(SAMPLE_DATA, path)
+            self.assertEqual(load_json(path), SAMPLE_DATA)
+
+    def test_non_ascii_kept(self):
+        self.assertIn("风格指南".encode("utf-8"), dumps_json(SAMPLE_DATA))
+        with WITHOUT_ORJSON:
+            self.assertIn("风格指南".encode("utf-8"), dumps_json(SAMPLE_DATA))
+
+    def test_compact_output(self):
+        self.assertNotIn(b"\n", dumps_json(SAMPLE_DATA, pretty=False))
+        with WITHOUT_ORJSON:
+            self.assertNotIn(b"\n", dumps_json(SAMPLE_DATA, pretty=False))
+            self.assertNotIn(b", ", dumps_json(SAMPLE_DATA, pretty=False))
+
+    def test_non_finite_floats(self):
+        data = {"ratio": float("nan"), "upper": float("inf"), "lower": float("-inf"), "note": None, "items": [0.5]}
+        expected = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        for patcher in (mock.patch.object(json_utils, "orjson", json_utils.orjson), WITHOUT_ORJSON):
+            with patcher, self.subTest(orjson=json_utils.orjson is not None):
+                # 与标准库一样写出 NaN/Infinity，不会被替换成 null
+                self.assertEqual(dumps_json(data), expected)
+                loaded = loads_json(dumps_json(data, pretty=False))
+                self.assertTrue(math.isnan(loaded["ratio"]))
+                self.assertEqual((loaded["upper"], loaded["lower"]), (math.inf, -math.inf))
+                self.assertIsNone(loaded["note"])
+
+                path = self.tmp_dir / "non_finite.json.gz"
+                dump_json(data, path)
+                self.assertEqual(load_json(path)["upper"], math.inf)
+
+    def test_stdlib_only_content(self):
+        # 超过64位的整数 orjson 无法序列化；标准库写出的 NaN orjson 无法解析
+        big = {"value": 2 ** 70}
+        self.assertEqual(loads_json(dumps_json(big)), big)
+        self.assertTrue(math.isnan(loads_json('{"a": NaN}')["a"]))
+        with self.assertRaises(ValueError):
+            loads_json(b'{"a": ')
+
+    def test_missing_file(self):
+        for name in ("missing.json", "missing.json.gz"):
+            with self.subTest(name=name):
+                with self.assertRaises(FileNotFoundError):
+                    load_json(self.tmp_dir / name)
+
+
+class TestStreamingHelpers(JsonUtilsTestCase):
+    """load_json_fields / count_json_items 在 ijson 与完整解析回退下结果一致"""
+
+    def setUp(self):
+        super().setUp()
+        self.path = self.write_json("data.json", SAMPLE_DATA)
+
+    def test_fields_fallback(self):
+        with WITHOUT_IJSON:
+            fields = load_json_fields(self.path, ("title", "total_rules", "ratio", "enabled", "note"))
+        self.assertEqual(
+            fields,
+            {"title": "风格指南", "total_rules": 3, "ratio": 0.75, "enabled": True, "note": None},
+        )
+
+    def test_fields_missing_key(self):
+        with WITHOUT_IJSON:
+            self.assertEqual(load_json_fields(self.path, ("total_rules", "absent")), {"total_rules": 3})
+
+    def test_count_fallback(self):
+        with WITHOUT_IJSON:
+            self.assertEqual(count_json_items(self.path, "batches"), 4)
+            self.assertEqual(count_json_items(self.path, "empty"), 0)
+            self.assertEqual(count_json_items(self.path, "absent"), 0)
+
+    @REQUIRES_IJSON
+    def test_fields_ijson_matches_fallback(self):
+        for keys in (("title", "total_rules", "ratio", "enabled", "note"), ("total_rules", "absent"), ()):
+            with self.subTest(keys=keys):
+                with WITHOUT_IJSON:
+                    expected = load_json_fields(self.path, keys)
+                self.assertEqual(load_json_fields(self.path, keys), expected)
+
+    @REQUIRES_IJSON
+    def test_count_ijson_matches_fallback(self):
+        for key in ("batches", "empty", "absent"):
+            with self.subTest(key=key):
+                with WITHOUT_IJSON:
+                    expected = count_json_items(self.path, key)
+                self.assertEqual(count_json_items(self.path, key), expected)
+
+    def test_missing_file_fallback(self):
+        missing = self.tmp_dir / "missing.json"
+        with WITHOUT_IJSON:
+            with self.assertRaises(FileNotFoundError):
+                load_json_fields(missing, ("total_rules",))
+            with self.assertRaises(FileNotFoundError):
+                count_json_items(missing, "batches")
+
+    @REQUIRES_IJSON
+    def test_missing_file_ijson(self):
+        missing = self.tmp_dir / "missing.json"
+        with self.assertRaises(FileNotFoundError):
+            load_json_fields(missing, ("total_rules",))
+        with self.assertRaises(FileNotFoundError):
+            count_json_items(missing, "batches")
+
+
+class TestLoadGuidePreview(JsonUtilsTestCase):
+    """load_guide_preview"""
+
+    def setUp(self):
+        super().setUp()
+        self.path = self.write_json("style_guide.json", SAMPLE_GUIDE)
+
+    def test_fallback_preview(self):
+        with WITHOUT_IJSON:
+            preview = load_guide_preview(self.path)
+        self.assertEqual(preview["style_guide_version"], "3.0")
+        self.assertEqual(preview["generation_date"], "2025-01-01")
+        self.assertEqual(preview["total_papers_analyzed"], 12)
+        self.assertEqual(preview["rule_summary"], SAMPLE_GUIDE["rule_summary"])
+        self.assertEqual(
+            [rule["description"] for rule in preview["core_rules"]], ["规则1", "规则3", "规则4"]
+        )
+        self.assertEqual(
+            preview["category_counts"], {"sentence.structure": 2, "vocabulary": 0, "transitions": 1}
+        )
+
+    def test_core_limit(self):
+        for core_limit, expected in ((0, []), (1, ["规则1"]), (2, ["规则1", "规则3"]), (10, ["规则1", "规则3", "规则4"])):
+            with self.subTest(core_limit=core_limit), WITHOUT_IJSON:
+                preview = load_guide_preview(self.path, core_limit=core_limit)
+                self.assertEqual([rule["description"] for rule in preview["core_rules"]], expected)
+
+    def test_missing_sections(self):
+        path = self.write_json("bare.json", {"style_guide_version": "1.0"})
+        with WITHOUT_IJSON:
+            preview = load_guide_preview(path)
+        self.assertEqual(
+            preview,
+            {"style_guide_version": "1.0", "rule_summary": {}, "core_rules": [], "category_counts": {}},
+        )
+
+    @REQUIRES_IJSON
+    def test_ijson_matches_fallback(self):
+        bare = self.write_json("bare.json", {"style_guide_version": "1.0"})
+        for path in (self.path, bare):
+            for core_limit in (0, 1, 2, 10):
+                with self.subTest(path=path.name, core_limit=core_limit):
+                    with WITHOUT_IJSON:
+                        expected = load_guide_preview(path, core_limit)
+                    self.assertEqual(load_guide_preview(path, core_limit), expected)
+
+    def test_category_counts_with_dotted_and_dict_categories(self):
+        guide = dict(SAMPLE_GUIDE, categories={
+            "sentence.structure": [{"id": 1}, {"id": 2}],
+            "a.b.item": [{"id": 3}],
+            "by_section": {"intro": [1, 2], "method": [3]},
+            "empty.dict": {},
+        })
+        path = self.write_json("categories.json", guide)
+        expected = {"sentence.structure": 2, "a.b.item": 1, "by_section": 2, "empty.dict": 0}
+        with WITHOUT_IJSON:
+            self.assertEqual(load_guide_preview(path)["category_counts"], expected)
+        if json_utils.ijson is not None:
+            self.assertEqual(load_guide_preview(path)["category_counts"], expected)
+
+    def test_missing_file_fallback(self):
+        with WITHOUT_IJSON, self.assertRaises(FileNotFoundError):
+            load_guide_preview(self.tmp_dir / "missing.json")
+
+    @REQUIRES_IJSON
+    def test_missing_file_ijson(self):
+        with self.assertRaises(FileNotFoundError):
+            load_guide_preview(self.tmp_dir / "missing.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+日志单次扫描测试
+
+LogQuery.scan_logs 应与原先基于 query_logs 的统计和最近错误/警告查询结果一致
+（包括同一时间戳下的先后顺序）。
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.log.query import LogQuery
+from src.log.utils import _stats_to_summary
+
+# 较旧的日志文件
+OLD_LOG = """\
+2025-01-01 09:00:00,000 - src.analysis - INFO - 开始分析
+2025-01-01 09:00:01,000 - src.analysis - ERROR - 旧错误1
+2025-01-01 09:00:02,000 - src.core - WARNING - 旧警告1
+2025-01-01 09:00:05,000 - src.core - ERROR - 同一时间的错误（旧文件）
+not a log line
+
+2025-01-01 09:00:06,000 - src.polishing - WARNING - 旧警告2
+"""
+
+# 较新的日志文件（最先读取），包含与旧文件相同的时间戳和文件内重复时间戳
+NEW_LOG = """\
+2025-01-02 10:00:00,000 - __main__ - INFO - 应用启动
+2025-01-01 09:00:05,000 - src.core - ERROR - 同一时间的错误（新文件）
+2025-01-02 10:00:01,000 - src.analysis - ERROR - 新错误1
+2025-01-02 10:00:01,000 - src.analysis - ERROR - 新错误2（与新错误1同一时间）
+2025-01-02 10:00:02,000 - src.polishing - WARNING - 新警告1
+2025-01-02 10:00:03,000 - src.polishing - DEBUG - 调试信息
+2025-01-02 10:00:04,000 - src.analysis - ERROR - 新错误3
+"""
+
+
+class TestScanLogs(unittest.TestCase):
+    """scan_logs 与 get_log_stats/search_errors/search_warnings 对照"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        logs_dir = Path(self._tmp.name)
+        old_log = logs_dir / "app_20250101.log"
+        new_log = logs_dir / "app_20250102.log"
+        old_log.write_text(OLD_LOG, encoding="utf-8")
+        new_log.write_text(NEW_LOG, encoding="utf-8")
+        # get_log_files 按修改时间从新到旧排序，固定修改时间保证读取顺序
+        os.utime(old_log, (1_700_000_000, 1_700_000_000))
+        os.utime(new_log, (1_700_000_100, 1_700_000_100))
+        self.query = LogQuery(str(logs_dir))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_stats_match_get_log_stats(self):
+        stats, _, _ = self.query.scan_logs()
+        self.assertEqual(stats, self.query.get_log_stats())
+        self.assertEqual(stats.total_entries, 12)
+        self.assertEqual(stats.error_count, 6)
+        self.assertEqual(stats.warning_count, 3)
+        self.assertEqual(_stats_to_summary(stats), _stats_to_summary(self.query.get_log_stats()))
+
+    def test_recent_entries_match_query_logs(self):
+        for limit in (1, 2, 3, 5, 6, 50):
+            with self.subTest(limit=limit):
+                _, errors, warnings = self.query.scan_logs(limit)
+                self.assertEqual(errors, self.query.search_errors(limit=limit))
+                self.assertEqual(warnings, self.query.search_warnings(limit=limit))
+
+    def test_same_timestamp_order(self):
+        _, errors, _ = self.query.scan_logs(10)
+        self.assertEqual(
+            [entry.message for entry in errors],
+            [
+                "新错误3",
+                "新错误1",
+                "新错误2（与新错误1同一时间）",
+                "同一时间的错误（新文件）",
+                "同一时间的错误（旧文件）",
+                "旧错误1",
+            ],
+        )
+
+    def test_empty_logs_dir(self):
+        with tempfile.TemporaryDirectory() as empty_dir:
+            query = LogQuery(empty_dir)
+            stats, errors, warnings = query.scan_logs()
+            expected = query.get_log_stats()
+        self.assertEqual(stats.total_entries, expected.total_entries)
+        self.assertEqual(stats.level_counts, expected.level_counts)
+        self.assertEqual(stats.logger_counts, expected.logger_counts)
+        self.assertEqual(stats.file_size, expected.file_size)
+        self.assertEqual((errors, warnings), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()